@@ -55,4 +55,5 @@ CONTINUE_ON_ERROR = True
 MAX_ERRORS_PER_FILE = 10
 
 # Performance
-CHUNK_SIZE = 2048 * 2048  # 4MB chunks for reading large files
\ No newline at end of file
+CHUNK_SIZE = 2048 * 2048  # 4MB chunks for reading large files
+LINE_CACHE_SIZE = 20000  # Max cached lines per table-line predicate (kept across documents)
\ No newline at end of file
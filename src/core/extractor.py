@@ -1,9 +1,15 @@
 """Fixed MD&A extractor that normalizes text before searching for sections and properly formats tables."""
 
+import os
 import re
+import html
+import logging
 from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Optional, Dict, Tuple
+from typing import Any, Optional, Dict, List, Tuple
 
 from src.models.filing import Filing, ExtractionResult
 from src.parsers.section_parser import SectionParser
@@ -12,11 +18,105 @@ from src.parsers.cross_reference_parser import CrossReferenceParser
 from src.parsers.text_normalizer import TextNormalizer
 from src.parsers.reference_resolver import ReferenceResolver
 from src.core.file_handler import FileHandler
-from src.utils.logger import get_logger, log_error
-from config.settings import OUTPUT_DIR
+from src.utils.logger import setup_logging, get_logger, log_error
+from config.settings import OUTPUT_DIR, VALID_EXTENSIONS
+
+try:  # Optional linear-time engine for the DOTALL block scans
+    import re2 as _block_re
+except ImportError:
+    _block_re = re
 
 logger = get_logger(__name__)
 
+# Precompiled patterns (avoid re-parsing pattern strings on every file)
+_BLOCK_TAGS = r'(?:p|div|br|h[1-6]|li|tr)'
+_BLOCK_TAG_RE = re.compile(rf'</{_BLOCK_TAGS}>|<{_BLOCK_TAGS}[^>]*>', re.IGNORECASE)
+_NBSP_RE = re.compile(r'&nbsp;?', re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Lazy DOTALL block patterns backtrack badly on unclosed tags (each opening
+# tag rescans the rest of the filing); RE2 runs them in linear time. Flags
+# are inline because re2.compile does not accept re flag values.
+_XBRL_BLOCK_RE = _block_re.compile(r'(?is)<xbrl:.*?>.*?</xbrl:.*?>')
+_IX_TAG_RE = re.compile(r'</?ix:.*?>', re.IGNORECASE)
+_NAMESPACED_TAG_RE = re.compile(r'<[^>]*:[^>]+>')
+
+_SEC_DOC_RE = _block_re.compile(r'(?is)<SEC-DOCUMENT>.*?</SEC-DOCUMENT>')
+_SEC_HEADER_RE = _block_re.compile(r'(?is)<SEC-HEADER>.*?</SEC-HEADER>')
+_TYPE_TAG_RE = re.compile(r'<TYPE>[^<]+', re.IGNORECASE)
+_SEQUENCE_TAG_RE = re.compile(r'<SEQUENCE>[^<]+', re.IGNORECASE)
+_FILENAME_TAG_RE = re.compile(r'<FILENAME>[^<]+', re.IGNORECASE)
+_EXCESS_NEWLINES_RE = re.compile(r'\n{4,}')
+
+_FILENAME_META_RE = re.compile(
+    r'(\d{8})_(10-[KQ](?:/A)?)_edgar_data_(\d{1,10})_([0-9\-]+)\.txt', re.IGNORECASE
+)
+
+# Header metadata unions: alternatives in priority order, one capture group
+# each, so match.lastindex identifies which alternative matched
+_CIK_RE = re.compile('|'.join([
+    r'CENTRAL INDEX KEY:\s*(\d+)',
+    r'CIK:\s*(\d+)',
+    r'C\.I\.K\.\s*NO\.\s*(\d+)',
+    r'COMMISSION FILE NUMBER:\s*\d+-(\d+)',
+]), re.IGNORECASE)
+
+_ANNUAL_REPORT_GROUP = 3  # Indicates 10-K
+_FORM_TYPE_RE = re.compile('|'.join([
+    r'FORM\s+(10-[KQ])(?:/A)?',
+    r'FORM\s+TYPE:\s*(10-[KQ])(?:/A)?',
+    r'(ANNUAL REPORT PURSUANT TO SECTION 13)',
+]), re.IGNORECASE)
+
+# Tried one by one: a later pattern is used if an earlier date won't parse
+_FILING_DATE_RES = [
+    re.compile(r'FILED AS OF DATE:\s*(\d{8})', re.IGNORECASE),
+    re.compile(r'DATE OF REPORT[^:]*:\s*(\d{4}-\d{2}-\d{2})', re.IGNORECASE),
+    re.compile(r'For the period ended\s+(\w+\s+\d{1,2},?\s+\d{4})', re.IGNORECASE),
+]
+
+
+@lru_cache(maxsize=4096)
+def _parse_filename_fields(filename: str) -> Tuple[Optional[str], Optional[datetime], Optional[str]]:
+    """
+    Parse CIK, filing date and form type from an EDGAR-style filename.
+
+    Cached because process_directory parses each name for the CIK filter
+    and extract_from_file parses it again.
+    """
+    cik = None
+    filing_date = None
+    form_type = None
+
+    match = _FILENAME_META_RE.search(filename)
+
+    if match:
+        date_str = match.group(1)
+        form_type = match.group(2).upper()
+        cik = match.group(3).zfill(10)  # Pad to 10 digits
+
+        try:
+            filing_date = datetime.strptime(date_str, '%Y%m%d')
+        except Exception as e:
+            logger.warning(f"Could not parse date from {date_str}: {e}")
+
+    return cik, filing_date, form_type
+
+
+def _search_by_priority(pattern: re.Pattern, text: str) -> Optional[re.Match]:
+    """
+    Return the first match of the highest-priority alternative in a union.
+
+    Equivalent to searching with each alternative in turn, but the text is
+    scanned once instead of once per alternative.
+    """
+    found = {}
+    for match in pattern.finditer(text):
+        if match.lastindex == 1:
+            return match
+        found.setdefault(match.lastindex, match)
+    return found[min(found)] if found else None
+
 
 class MDNAExtractor:
     """Fixed extractor that normalizes before section detection and properly formats tables."""
@@ -102,15 +202,16 @@ class MDNAExtractor:
             # 7) Sub-sections, tables, cross-refs - CRITICAL TABLE PROCESSING
             subsections = self.section_parser.extract_subsections(mdna_text)
 
-            # Identify tables in the MD&A text
+            # Identify tables in the MD&A text (lines are split once and
+            # reused for preservation)
             logger.debug("Identifying tables in MD&A text...")
-            tables = self.table_parser.identify_tables(mdna_text)
+            mdna_lines, tables = self.table_parser.parse(mdna_text)
             if tables:
                 logger.info(f"Found {len(tables)} tables in MD&A")
 
                 # CRITICAL FIX: Apply table formatting to preserve table structure
                 logger.debug("Applying table formatting to preserve structure...")
-                mdna_text = self.table_parser.preserve_tables_in_text(mdna_text, tables)
+                mdna_text = self.table_parser.preserve_tables_in_lines(mdna_lines, tables)
                 logger.info("Table formatting applied successfully")
             else:
                 logger.debug("No tables found in MD&A text")
@@ -181,55 +282,64 @@ class MDNAExtractor:
 
     def _remove_html_tags(self, text: str) -> str:
         """Remove HTML tags while preserving text content."""
-        # First, replace common block tags with newlines to preserve structure
-        block_tags = ['p', 'div', 'br', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'tr']
-        for tag in block_tags:
-            text = re.sub(f'</{tag}>', '\n', text, flags=re.IGNORECASE)
-            text = re.sub(f'<{tag}[^>]*>', '\n', text, flags=re.IGNORECASE)
+        # Plain text without any markup or entities needs none of the passes
+        has_tags = '<' in text
+        has_entities = '&' in text
+
+        if has_tags:
+            # First, replace block tags with newlines to preserve structure
+            # (one alternation instead of a pass per tag name)
+            text = _BLOCK_TAG_RE.sub('\n', text)
 
-        # Replace &nbsp; with space
-        text = re.sub(r'&nbsp;?', ' ', text, flags=re.IGNORECASE)
+        if has_entities:
+            # Replace &nbsp; with space
+            text = _NBSP_RE.sub(' ', text)
 
-        # Remove all remaining HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        if has_tags:
+            # Remove all remaining HTML tags
+            text = _HTML_TAG_RE.sub('', text)
 
-        # Decode HTML entities
-        import html
-        text = html.unescape(text)
+        if has_entities:
+            # Decode HTML entities
+            text = html.unescape(text)
 
         return text
 
     def _remove_xbrl_tags(self, text: str) -> str:
         """Remove XBRL tags and namespaces."""
+        # _remove_html_tags has already dropped every complete tag, so only
+        # entity-decoded markup can remain; skip the scans when there is none
+        if '<' not in text:
+            return text
+
         # Remove XBRL instance documents
-        text = re.sub(r'<xbrl:.*?>.*?</xbrl:.*?>', '', text, flags=re.DOTALL | re.IGNORECASE)
+        text = _XBRL_BLOCK_RE.sub('', text)
 
         # Remove inline XBRL tags
-        text = re.sub(r'<ix:.*?>', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'</ix:.*?>', '', text, flags=re.IGNORECASE)
+        text = _IX_TAG_RE.sub('', text)
 
         # Remove other XBRL-related tags
-        text = re.sub(r'<[^>]*:[^>]+>', '', text)
+        text = _NAMESPACED_TAG_RE.sub('', text)
 
         return text
 
     def _clean_sec_specific_content(self, text: str) -> str:
         """Remove SEC-specific artifacts."""
         # Remove EDGAR headers
-        text = re.sub(r'<SEC-DOCUMENT>.*?</SEC-DOCUMENT>', '', text, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r'<SEC-HEADER>.*?</SEC-HEADER>', '', text, flags=re.DOTALL | re.IGNORECASE)
+        text = _SEC_DOC_RE.sub('', text)
+        text = _SEC_HEADER_RE.sub('', text)
 
         # Remove TYPE tags
-        text = re.sub(r'<TYPE>[^<]+', '', text, flags=re.IGNORECASE)
+        text = _TYPE_TAG_RE.sub('', text)
 
         # Remove SEQUENCE tags
-        text = re.sub(r'<SEQUENCE>[^<]+', '', text, flags=re.IGNORECASE)
+        text = _SEQUENCE_TAG_RE.sub('', text)
 
         # Remove FILENAME tags
-        text = re.sub(r'<FILENAME>[^<]+', '', text, flags=re.IGNORECASE)
+        text = _FILENAME_TAG_RE.sub('', text)
 
         # Remove excessive newlines
-        text = re.sub(r'\n{4,}', '\n\n\n', text)
+        text = _EXCESS_NEWLINES_RE.sub('\n\n\n', text)
 
         return text
 
@@ -283,41 +393,15 @@ class MDNAExtractor:
 
     def _parse_filename_metadata(self, file_path: Path) -> Tuple[Optional[str], Optional[datetime], Optional[str]]:
         """Parse metadata from filename formatted as YYYYMMDD_FormType_edgar_data_CIK_AccessionNumber.txt"""
-        filename = file_path.name
-        cik = None
-        filing_date = None
-        form_type = None
-
-        pattern = r'(\d{8})_(10-[KQ](?:/A)?)_edgar_data_(\d{1,10})_([0-9\-]+)\.txt'
-        match = re.search(pattern, filename, re.IGNORECASE)
-
-        if match:
-            date_str = match.group(1)
-            form_type = match.group(2).upper()
-            cik = match.group(3).zfill(10)  # Pad to 10 digits
-
-            try:
-                filing_date = datetime.strptime(date_str, '%Y%m%d')
-            except Exception as e:
-                logger.warning(f"Could not parse date from {date_str}: {e}")
-
-        return cik, filing_date, form_type
+        return _parse_filename_fields(file_path.name)
 
     def _extract_cik(self, content: str) -> Optional[str]:
         """Extract CIK from normalized content."""
-        patterns = [
-            r'CENTRAL INDEX KEY:\s*(\d+)',
-            r'CIK:\s*(\d+)',
-            r'C\.I\.K\.\s*NO\.\s*(\d+)',
-            r'COMMISSION FILE NUMBER:\s*\d+-(\d+)'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                cik = match.group(1).strip()
-                # Pad to 10 digits
-                return cik.zfill(10)
+        match = _search_by_priority(_CIK_RE, content)
+        if match:
+            cik = match.group(match.lastindex).strip()
+            # Pad to 10 digits
+            return cik.zfill(10)
 
         return None
 
@@ -326,41 +410,30 @@ class MDNAExtractor:
         # Look in first 1000 characters
         header = content[:1000]
 
-        patterns = [
-            r'FORM\s+(10-[KQ])(?:/A)?',
-            r'FORM\s+TYPE:\s*(10-[KQ])(?:/A)?',
-            r'ANNUAL REPORT PURSUANT TO SECTION 13'  # Indicates 10-K
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, header, re.IGNORECASE)
-            if match:
-                if 'ANNUAL REPORT' in pattern:
-                    return '10-K'
-                form_type = match.group(1).upper()
-                # Check for amendment
-                if '/A' in match.group(0).upper():
-                    form_type += '/A'
-                return form_type
+        match = _search_by_priority(_FORM_TYPE_RE, header)
+        if match:
+            if match.lastindex == _ANNUAL_REPORT_GROUP:
+                return '10-K'
+            form_type = match.group(match.lastindex).upper()
+            # Check for amendment
+            if '/A' in match.group(0).upper():
+                form_type += '/A'
+            return form_type
 
         # Default based on content
-        if 'FORM 10-Q' in header.upper():
+        header_upper = header.upper()
+        if 'FORM 10-Q' in header_upper:
             return '10-Q'
-        elif 'FORM 10-K' in header.upper():
+        elif 'FORM 10-K' in header_upper:
             return '10-K'
 
         return '10-K'  # Default assumption
 
     def _extract_filing_date(self, content: str) -> Optional[datetime]:
         """Extract filing date from normalized content."""
-        patterns = [
-            r'FILED AS OF DATE:\s*(\d{8})',
-            r'DATE OF REPORT[^:]*:\s*(\d{4}-\d{2}-\d{2})',
-            r'For the period ended\s+(\w+\s+\d{1,2},?\s+\d{4})'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, content[:2000], re.IGNORECASE)
+        header = content[:2000]
+        for pattern in _FILING_DATE_RES:
+            match = pattern.search(header)
             if match:
                 date_str = match.group(1)
 
@@ -388,15 +461,17 @@ class MDNAExtractor:
         output_filename = f"{filing.cik}_{company_safe}_{form_type_safe}_{year_str}.txt"
         output_path = self.output_dir / output_filename
 
-        # Format output content
-        output_content = self._format_output(result)
-
-        # Save file
-        self.file_handler.write_file(output_path, output_content)
+        # Stream the formatted lines to disk rather than joining them into
+        # one more copy of the MD&A text first
+        self.file_handler.write_lines(output_path, self._output_lines(result))
         logger.info(f"Saved extraction to: {output_path}")
 
     def _format_output(self, result: ExtractionResult) -> str:
         """Format extraction result for output with proper table formatting."""
+        return '\n'.join(self._output_lines(result))
+
+    def _output_lines(self, result: ExtractionResult) -> List[str]:
+        """Build the output lines (header, MD&A text, table summary) for a result."""
         output = []
 
         # Header
@@ -429,7 +504,7 @@ class MDNAExtractor:
                     output.append(f"  Title: {table.title}")
                 output.append("")
 
-        return '\n'.join(output)
+        return output
 
     def _parse_file_metadata_simple(self, file_path: Path) -> Tuple[Optional[str], Optional[int], Optional[str]]:
         """Simple metadata parsing for compatibility."""
@@ -437,24 +512,57 @@ class MDNAExtractor:
         year = filing_date.year if filing_date else None
         return cik, year, form_type
 
-    def process_directory(self, input_dir: Path, cik_filter=None) -> Dict[str, int]:
-        """Process directory of text files."""
+    def _worker_init_args(self) -> Dict[str, Any]:
+        """
+        Constructor keyword arguments that rebuild this extractor in a worker.
+
+        Subclasses whose __init__ takes other arguments override this. State
+        set on the instance after construction is not carried over.
+        """
+        return {"output_dir": self.output_dir}
+
+    def process_directory(self, input_dir: Path, cik_filter=None,
+                          max_workers: int = 1) -> Dict[str, int]:
+        """Process directory of text files.
+
+        With max_workers > 1, files are spread over a process pool (regex
+        parsing holds the GIL, which rules out threads). The CIK filter is
+        applied up front in this process. Each worker builds its own
+        type(self) from _worker_init_args() and configures logging. A file
+        whose extraction raises in a worker counts as failed. If a worker
+        process dies, the pool is unusable, and every file without a result
+        yet is counted as not processed rather than failed.
+
+        Args:
+            input_dir: Directory containing filing text files
+            cik_filter: Optional CIKFilter restricting which filings to process
+            max_workers: Number of worker processes (e.g. os.cpu_count());
+                the default of 1 processes serially in this process
+
+        Returns:
+            Processing statistics
+        """
         stats = {
             "total_files": 0,
             "successful": 0,
             "failed": 0,
-            "filtered_out": 0
+            "filtered_out": 0,
+            "not_processed": 0
         }
 
-        # Find text files
-        text_files = list(input_dir.glob("*.txt")) + list(input_dir.glob("*.TXT"))
+        # Find text files (one directory pass instead of a glob per extension)
+        extensions = tuple(VALID_EXTENSIONS)
+        with os.scandir(input_dir) as entries:
+            text_files = [Path(entry.path) for entry in entries
+                          if entry.name.endswith(extensions) and entry.is_file()]
         stats["total_files"] = len(text_files)
 
         logger.info(f"Found {len(text_files)} text files to process")
 
-        for file_path in text_files:
-            # Check CIK filter if provided
-            if cik_filter and cik_filter.has_cik_filters():
+        # Check CIK filter if provided
+        if cik_filter and cik_filter.has_cik_filters():
+            selected_files = []
+            for file_path in text_files:
                 cik, year, form_type = self._parse_file_metadata_simple(file_path)
 
                 if not cik_filter.should_process_filing(cik, form_type, year):
@@ -462,11 +570,57 @@ class MDNAExtractor:
                     logger.info(f"Filtered out: {file_path.name}")
                     continue
 
-            # Process file
-            result = self.extract_from_file(file_path)
-            if result:
+                selected_files.append(file_path)
+            text_files = selected_files
+
+        # Process files
+        if max_workers > 1 and len(text_files) > 1:
+            verbose = logging.getLogger().isEnabledFor(logging.DEBUG)
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(text_files)),
+                                     initializer=_init_worker,
+                                     initargs=(type(self), self._worker_init_args(),
+                                               verbose)) as executor:
+                futures = [executor.submit(_extract_in_worker, file_path)
+                           for file_path in text_files]
+                results = []
+                for file_path, future in zip(text_files, futures):
+                    try:
+                        results.append(future.result())
+                    except BrokenProcessPool:
+                        # A worker died; which file killed it is unknown, and
+                        # the files still pending were never run
+                        log_error("Not processed: worker pool terminated", file_path)
+                        results.append(None)
+                    except Exception as e:
+                        log_error(f"Worker failed: {e}", file_path)
+                        results.append(False)
+        else:
+            results = [self.extract_from_file(file_path) is not None
+                       for file_path in text_files]
+
+        for success in results:
+            if success is None:
+                stats["not_processed"] += 1
+            elif success:
                 stats["successful"] += 1
             else:
                 stats["failed"] += 1
 
-        return stats
\ No newline at end of file
+        return stats
+
+
+# Per-process extractor used by process_directory's worker pool
+_worker_extractor: Optional[MDNAExtractor] = None
+
+
+def _init_worker(extractor_class: type, init_args: Dict[str, Any], verbose: bool) -> None:
+    """Configure logging and build the extractor once per worker process."""
+    global _worker_extractor
+    # Spawned workers start without the parent's handlers
+    setup_logging(verbose=verbose)
+    _worker_extractor = extractor_class(**init_args)
+
+
+def _extract_in_worker(file_path: Path) -> bool:
+    """Extract a single file in a worker process; returns success."""
+    return _worker_extractor.extract_from_file(file_path) is not None
\ No newline at end of file
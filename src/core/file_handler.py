@@ -1,8 +1,9 @@
 """File handling utilities for reading and writing files."""
 
+import mmap
 import chardet
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Iterable
 from config.settings import (
     ENCODING_PREFERENCES,
     MAX_FILE_SIZE_MB,
@@ -36,34 +37,53 @@ class FileHandler:
             logger.error(f"File too large ({file_size_mb:.1f} MB): {file_path}")
             return None
 
+        # Map the file instead of reading it into a bytes object, so each
+        # decode attempt works from the page cache without an extra copy
+        try:
+            with open(file_path, 'rb') as f:
+                if file_path.stat().st_size == 0:  # mmap cannot map empty files
+                    return ''
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return self._decode_mapped(mm, file_path)
+        except Exception as e:
+            logger.error(f"Error reading file {file_path}: {e}")
+            return None
+
+    def _decode_mapped(self, mm: mmap.mmap, file_path: Path) -> Optional[str]:
+        """
+        Decode a memory-mapped file, trying preferred encodings first.
+
+        Args:
+            mm: Read-only mapping of the file
+            file_path: Path to file (for logging)
+
+        Returns:
+            File content as string or None if no encoding could be detected
+        """
         # Try preferred encodings first
         for encoding in ENCODING_PREFERENCES:
             try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    content = f.read()
-                logger.debug(f"Successfully read file with {encoding} encoding")
-                return content
+                content = str(mm, encoding)
+                logger.debug("Successfully read file with %s encoding", encoding)
+                return self._translate_newlines(content)
             except UnicodeDecodeError:
                 continue
 
         # If preferred encodings fail, detect encoding
-        try:
-            with open(file_path, 'rb') as f:
-                raw_data = f.read()
-                result = chardet.detect(raw_data)
-                encoding = result['encoding']
-
-            if encoding:
-                logger.info(f"Detected encoding: {encoding}")
-                with open(file_path, 'r', encoding=encoding) as f:
-                    return f.read()
-            else:
-                logger.error(f"Could not detect encoding for: {file_path}")
-                return None
+        encoding = chardet.detect(mm[:])['encoding']
+        if encoding:
+            logger.info(f"Detected encoding: {encoding}")
+            return self._translate_newlines(str(mm, encoding))
 
-        except Exception as e:
-            logger.error(f"Error reading file {file_path}: {e}")
-            return None
+        logger.error(f"Could not detect encoding for: {file_path}")
+        return None
+
+    @staticmethod
+    def _translate_newlines(content: str) -> str:
+        """Apply the universal-newline translation text-mode reads perform."""
+        if '\r' not in content:
+            return content
+        return content.replace('\r\n', '\n').replace('\r', '\n')
 
     def read_file_chunked(self, file_path: Path) -> Optional[str]:
         """
@@ -116,7 +136,33 @@ class FileHandler:
             with open(file_path, 'w', encoding=encoding) as f:
                 f.write(content)
 
-            logger.debug(f"Successfully wrote file: {file_path}")
+            logger.debug("Successfully wrote file: %s", file_path)
+
+        except Exception as e:
+            logger.error(f"Error writing file {file_path}: {e}")
+            raise
+
+    def write_lines(self, file_path: Path, lines: Iterable[str], encoding: str = 'utf-8'):
+        """
+        Write lines joined by newlines, without building the joined string.
+
+        Args:
+            file_path: Path to output file
+            lines: Lines to write (no trailing newline after the last one)
+            encoding: Output encoding
+        """
+        try:
+            # Create parent directory if needed
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(file_path, 'w', encoding=encoding) as f:
+                separator = ''
+                for line in lines:
+                    f.write(separator)
+                    f.write(line)
+                    separator = '\n'
+
+            logger.debug("Successfully wrote file: %s", file_path)
 
         except Exception as e:
             logger.error(f"Error writing file {file_path}: {e}")
@@ -138,7 +138,8 @@ class FilingManager:
 
         # Log 10-Q fallbacks
         for file_path in to_process:
-            if '10-Q' in file_path.name.upper() or '10Q' in file_path.name.upper():
+            name_upper = file_path.name.upper()
+            if '10-Q' in name_upper or '10Q' in name_upper:
                 logger.info(f"Using 10-Q as fallback (no 10-K available): {file_path.name}")
 
         return {
@@ -72,7 +72,7 @@ class ZipProcessor:
                                 cik, year, form_type = self.extractor._parse_file_metadata_simple(file_path)
                                 if not cik_filter.should_process_filing(cik, form_type, year):
                                     stats["filtered_out"] += 1
-                                    logger.debug(f"Filtered out by CIK filter: {member} (CIK: {cik})")
+                                    logger.debug("Filtered out by CIK filter: %s (CIK: %s)", member, cik)
                                     continue
 
                             # register with FilingManager for selection logic
@@ -81,7 +81,7 @@ class ZipProcessor:
                                 self.filing_manager.add_filing(file_path, cik, year, form_type)
                                 candidates.append(file_path)
                             else:
-                                logger.debug(f"Metadata parse failed, skipping registration: {member}")
+                                logger.debug("Metadata parse failed, skipping registration: %s", member)
 
                         except Exception as e:
                             stats["failed"] += 1
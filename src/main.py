@@ -1,6 +1,7 @@
 """Modified main entry point with enhanced table preservation."""
 
 import argparse
+import re
 import sys
 import signal
 import atexit
@@ -19,6 +20,10 @@ from config.settings import INPUT_DIR, OUTPUT_DIR, CIK_INPUT_DIR
 
 logger = get_logger(__name__)
 
+# CIK header lines checked while pre-filtering zip members
+_CENTRAL_INDEX_KEY_RE = re.compile(r'CENTRAL INDEX KEY:\s*(\d+)')
+_CIK_RE = re.compile(r'CIK:\s*(\d+)')
+
 # Global cleanup paths
 cleanup_paths = []
 
@@ -211,10 +216,9 @@ class TablePreservingZipProcessor(ZipProcessor):
                             content_str = content.decode('utf-8', errors='ignore')
 
                             # Extract CIK from content
-                            import re
-                            cik_match = re.search(r'CENTRAL INDEX KEY:\s*(\d+)', content_str)
+                            cik_match = _CENTRAL_INDEX_KEY_RE.search(content_str)
                             if not cik_match:
-                                cik_match = re.search(r'CIK:\s*(\d+)', content_str)
+                                cik_match = _CIK_RE.search(content_str)
 
                             if cik_match:
                                 cik = cik_match.group(1).zfill(10)
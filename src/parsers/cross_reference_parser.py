@@ -117,24 +117,25 @@ class CrossReferenceParser:
     def _parse_reference(self, match: re.Match, text: str) -> Optional[CrossReference]:
         """Parse a regex match into a CrossReference object."""
         full_match = match.group(0)
+        match_lower = full_match.lower()
 
         # Determine reference type and target
-        if 'note' in full_match.lower():
+        if 'note' in match_lower:
             ref_type = 'note'
             # Extract note number
             numbers = re.findall(r'\d+', full_match)
             target_id = numbers[0] if numbers else None
-        elif 'item' in full_match.lower():
+        elif 'item' in match_lower:
             ref_type = 'item'
             # Extract item number (may include letter)
             item_match = re.search(r'item\s*(\d+[a-z]?)', full_match, re.IGNORECASE)
             target_id = item_match.group(1) if item_match else None
-        elif 'exhibit' in full_match.lower():
+        elif 'exhibit' in match_lower:
             ref_type = 'exhibit'
             # Extract exhibit number
             exhibit_match = re.search(r'exhibit\s*([\d.]+)', full_match, re.IGNORECASE)
             target_id = exhibit_match.group(1) if exhibit_match else None
-        elif 'section' in full_match.lower():
+        elif 'section' in match_lower:
             ref_type = 'section'
             # Extract section title
             quote_match = re.search(r'["\']([^"\']+)["\']', full_match)
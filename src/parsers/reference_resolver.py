@@ -99,8 +99,9 @@ class ReferenceResolver:
         }
 
         # Check for specific exhibit patterns
+        doc_type_lower = doc_type.lower()
         for key, patterns_list in patterns.items():
-            if key.lower() in doc_type.lower():
+            if key.lower() in doc_type_lower:
                 return patterns_list
 
         return None
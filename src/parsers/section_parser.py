@@ -1,6 +1,7 @@
 """Parser for identifying and extracting MD&A sections from SEC filings."""
 
 import re
+from bisect import bisect_left
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict
 from dataclasses import dataclass
@@ -9,6 +10,58 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_NEWLINE_RE = re.compile(r'\n')
+
+# Common section endings used when no standard end marker is found. The
+# leftmost match of the union is the earliest ending of any kind
+_FALLBACK_END_RE = re.compile('|'.join([
+    r"(?:^|\n)\s*SIGNATURES\s*(?:\n|$)",
+    r"(?:^|\n)\s*EXHIBIT\s+INDEX\s*(?:\n|$)",
+    r"(?:^|\n)\s*PART\s+III\s*(?:\n|$)",
+]), re.IGNORECASE | re.MULTILINE)
+
+# TOC leaders: dot runs, ellipses or a trailing page number
+_TOC_LEADER_RE = re.compile(r'\.{5,}|…{3,}|\s+\d{1,3}\s*$')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Markers that open a Table of Contents, and section starts that show the
+# TOC has ended. Only whether any alternative matches is used
+_TOC_MARKER_RE = re.compile('|'.join([
+    r'TABLE\s+OF\s+CONTENTS',
+    r'INDEX\s+TO\s+(?:FINANCIAL\s+STATEMENTS|FORM)',
+    r'(?:^|\n)\s*(?:Page|PART|ITEM)\s*(?:No\.?|Number)?\s*$',  # Column headers
+]), re.IGNORECASE | re.MULTILINE)
+_TOC_EXIT_RE = re.compile('|'.join([
+    r'(?:^|\n)\s*(?:PART\s+I\s*$|BUSINESS\s*$|RISK\s+FACTORS)',
+    r'(?:^|\n)\s*FORWARD.?LOOKING\s+STATEMENTS',
+    r'(?:^|\n)\s*(?:INTRODUCTION|OVERVIEW|SUMMARY)',
+]), re.IGNORECASE | re.MULTILINE)
+
+# Phrases that mention Item 2 without starting it
+_ITEM_2_REFERENCE_RE = re.compile('|'.join([
+    r'(?:see|refer\s*to|reference\s*to)\s*Item\s*2',
+    r'Item\s*2\s*(?:above|below|herein)',
+    r'(?:disclosed|discussed)\s*in\s*Item\s*2',
+    r'pursuant\s*to\s*Item\s*2',
+]), re.IGNORECASE)
+
+
+class _LineIndex:
+    """Maps character positions to 1-based line numbers via bisect.
+
+    The newline offsets are built on first lookup, so a scan with no
+    matches never pays for them.
+    """
+
+    def __init__(self, text: str):
+        self._text = text
+        self._newline_offsets: Optional[List[int]] = None
+
+    def line_number(self, pos: int) -> int:
+        if self._newline_offsets is None:
+            self._newline_offsets = [m.start() for m in _NEWLINE_RE.finditer(self._text)]
+        return bisect_left(self._newline_offsets, pos) + 1
+
 
 @dataclass
 class SectionBoundary:
@@ -128,12 +181,13 @@ class SectionParser:
             )
 
             # Add any Part I hits with higher confidence
+            line_index = _LineIndex(text)
             for match in part_i_item_2_pattern.finditer(text):
                 boundary = SectionBoundary(
                     pattern_matched=match.group(0),
                     start_pos=match.start(),
                     end_pos=match.end(),
-                    line_number=text[:match.start()].count('\n') + 1,
+                    line_number=line_index.line_number(match.start()),
                     confidence=1.5  # Higher confidence for Part I pattern
                 )
                 all_item_2_matches.append(boundary)
@@ -171,11 +225,12 @@ class SectionParser:
             return []
 
         all_matches = []
+        line_index = _LineIndex(text)
 
         for i, pattern in enumerate(self.patterns[pattern_key]):
             for match in pattern.finditer(text):  # Use finditer instead of search
                 confidence = 1.0 - (i * 0.1)
-                line_number = text[:match.start()].count('\n') + 1
+                line_number = line_index.line_number(match.start())
 
                 boundary = SectionBoundary(
                     pattern_matched=pattern.pattern,
@@ -208,17 +263,18 @@ class SectionParser:
         # If document is very short (like in tests), adjust minimum position
         if len(text) < min_position * 2:
             min_position = min(1000, len(text) // 4)  # Use 1KB or 25% of doc length
-            logger.debug(f"Short document detected ({len(text)} chars), adjusted min_position to {min_position}")
+            logger.debug("Short document detected (%d chars), adjusted min_position to %d",
+                         len(text), min_position)
 
         for match in matches:
             # Skip if too early in document (unless document is very short)
             if match.start_pos < min_position and len(text) > 10000:
-                logger.debug(f"Skipping match at {match.start_pos} - too early (< {min_position_kb}KB)")
+                logger.debug("Skipping match at %d - too early (< %dKB)", match.start_pos, min_position_kb)
                 continue
 
             # Check for TOC markers before this match
             if self._is_in_toc(text, match):
-                logger.debug(f"Skipping match at {match.start_pos} - appears to be in TOC")
+                logger.debug("Skipping match at %d - appears to be in TOC", match.start_pos)
                 continue
 
             # Check if this is followed by actual content (not just page numbers or next TOC entry)
@@ -228,9 +284,10 @@ class SectionParser:
                 # For short documents/tests, be more lenient
                 if len(text) < 5000:
                     logger.debug(
-                        f"Short document - accepting match at {match.start_pos} despite limited following content")
+                        "Short document - accepting match at %d despite limited following content",
+                        match.start_pos)
                     return match
-                logger.debug(f"Skipping match at {match.start_pos} - no substantial content follows")
+                logger.debug("Skipping match at %d - no substantial content follows", match.start_pos)
 
         # If all matches were filtered, try with relaxed criteria
         if min_position_kb > 0:
@@ -255,14 +312,14 @@ class SectionParser:
         # Check for signs of real content
         if len(cleaned) < 100:
             # For short content, just check it's not obviously TOC
-            return not re.search(r'\.{5,}|…{3,}|\s+\d{1,3}\s*$', following_text)
+            return not _TOC_LEADER_RE.search(following_text)
 
         # Check for page numbers or dots (common in TOC)
-        if re.search(r'\.{5,}|…{3,}|\s+\d{1,3}\s*$', following_text[:200]):
+        if _TOC_LEADER_RE.search(following_text[:200]):
             return False  # Looks like TOC dots or page numbers
 
         # Check for multiple short lines (TOC characteristic)
-        lines = following_text.split('\n')[:10]
+        lines = following_text.split('\n', 10)[:10]  # Only split off what is used
         short_lines = [l for l in lines if 0 < len(l.strip()) < 50]
         if len(short_lines) > 5:
             return False  # Too many short lines
@@ -274,12 +331,13 @@ class SectionParser:
             'md&a content', 'discussion', 'analysis'  # Added test-friendly keywords
         ]
 
-        indicators_found = sum(1 for ind in mdna_indicators if ind.lower() in cleaned.lower())
-        if indicators_found >= 1:  # Reduced from 2 for shorter content
+        cleaned_lower = cleaned.lower()
+        # One indicator is enough (reduced from 2 for shorter content)
+        if any(ind in cleaned_lower for ind in mdna_indicators):
             return True  # Looks like MD&A content
 
         # Check word count of substantial sentences
-        sentences = re.split(r'[.!?]+', cleaned)
+        sentences = _SENTENCE_SPLIT_RE.split(cleaned)
         substantial_sentences = [s for s in sentences if len(s.split()) > 5]  # Reduced from 10
 
         return len(substantial_sentences) >= 1  # Reduced from 2
@@ -294,35 +352,20 @@ class SectionParser:
         look_back = min(5000, match.start_pos)
         preceding_text = text[max(0, match.start_pos - look_back):match.start_pos]
 
-        # TOC patterns
-        toc_patterns = [
-            r'TABLE\s+OF\s+CONTENTS',
-            r'INDEX\s+TO\s+(?:FINANCIAL\s+STATEMENTS|FORM)',
-            r'(?:^|\n)\s*(?:Page|PART|ITEM)\s*(?:No\.?|Number)?\s*$',  # Column headers
-        ]
-
         # Check if we're in a TOC
-        for pattern in toc_patterns:
-            if re.search(pattern, preceding_text, re.IGNORECASE | re.MULTILINE):
-                # Now check if we've exited the TOC
-                # Look for substantial text blocks or section starts
-                exit_patterns = [
-                    r'(?:^|\n)\s*(?:PART\s+I\s*$|BUSINESS\s*$|RISK\s+FACTORS)',
-                    r'(?:^|\n)\s*FORWARD.?LOOKING\s+STATEMENTS',
-                    r'(?:^|\n)\s*(?:INTRODUCTION|OVERVIEW|SUMMARY)',
-                ]
-
-                for exit_pattern in exit_patterns:
-                    if re.search(exit_pattern, preceding_text, re.IGNORECASE | re.MULTILINE):
-                        return False  # We've exited the TOC
-
-                # Check for dense text (TOCs have sparse text)
-                lines = preceding_text.split('\n')[-20:]  # Last 20 lines
-                non_empty_lines = [l for l in lines if len(l.strip()) > 20]
-                if len(non_empty_lines) > 10:
-                    return False  # Too much text for a TOC
-
-                return True  # Still in TOC
+        if _TOC_MARKER_RE.search(preceding_text):
+            # Now check if we've exited the TOC
+            # Look for substantial text blocks or section starts
+            if _TOC_EXIT_RE.search(preceding_text):
+                return False  # We've exited the TOC
+
+            # Check for dense text (TOCs have sparse text)
+            lines = preceding_text.rsplit('\n', 20)[-20:]  # Last 20 lines
+            non_empty_lines = [l for l in lines if len(l.strip()) > 20]
+            if len(non_empty_lines) > 10:
+                return False  # Too much text for a TOC
+
+            return True  # Still in TOC
 
         return False
 
@@ -333,18 +376,7 @@ class SectionParser:
         context_end = min(len(text), match.end_pos + 200)
         context = text[context_start:context_end]
 
-        ref_patterns = [
-            r'(?:see|refer\s*to|reference\s*to)\s*Item\s*2',
-            r'Item\s*2\s*(?:above|below|herein)',
-            r'(?:disclosed|discussed)\s*in\s*Item\s*2',
-            r'pursuant\s*to\s*Item\s*2',
-        ]
-
-        for pattern in ref_patterns:
-            if re.search(pattern, context, re.IGNORECASE):
-                return True
-
-        return False
+        return _ITEM_2_REFERENCE_RE.search(context) is not None
 
 
     def _extract_from_validated_start(self, start_match: SectionBoundary, text: str, form_type: str) -> Optional[
@@ -459,31 +491,26 @@ class SectionParser:
             logger.warning(f"Pattern key '{pattern_key}' not found in compiled patterns")
             return None
 
-        matches = []
-
+        # Earlier patterns have higher confidence, so the first pattern that
+        # matches wins and the remaining ones need not be searched
         for i, pattern in enumerate(self.patterns[pattern_key]):
             match = pattern.search(text)
             if match:
                 # Calculate confidence based on pattern specificity
-                confidence = 1.0 - (i * 0.1)  # Earlier patterns have higher confidence
+                confidence = 1.0 - (i * 0.1)
 
                 # Get line number
-                line_number = text[:match.start()].count('\n') + 1
+                line_number = text.count('\n', 0, match.start()) + 1
 
-                boundary = SectionBoundary(
+                return SectionBoundary(
                     pattern_matched=pattern.pattern,
                     start_pos=match.start(),
                     end_pos=match.end(),
                     line_number=line_number,
                     confidence=confidence
                 )
-                matches.append(boundary)
 
-        if not matches:
-            return None
-
-        # Return match with highest confidence
-        return max(matches, key=lambda x: x.confidence)
+        return None
 
     def _find_fallback_end(self, text: str, start_pos: int) -> Optional[int]:
         """
@@ -496,27 +523,9 @@ class SectionParser:
         Returns:
             End position or None
         """
-        # Look for common section endings
-        fallback_patterns = [
-            r"(?:^|\n)\s*SIGNATURES\s*(?:\n|$)",
-            r"(?:^|\n)\s*EXHIBIT\s+INDEX\s*(?:\n|$)",
-            r"(?:^|\n)\s*PART\s+III\s*(?:\n|$)",
-        ]
-
-        compiled_fallbacks = [
-            re.compile(p, re.IGNORECASE | re.MULTILINE)
-            for p in fallback_patterns
-        ]
-
-        end_positions = []
-        search_text = text[start_pos:]
-
-        for pattern in compiled_fallbacks:
-            match = pattern.search(search_text)
-            if match:
-                end_positions.append(start_pos + match.start())
-
-        return min(end_positions) if end_positions else None
+        # Look for the earliest common section ending
+        match = _FALLBACK_END_RE.search(text[start_pos:])
+        return start_pos + match.start() if match else None
 
     def validate_section(self, text: str, start: int, end: int, form_type: str = "10-K") -> Dict[str, any]:
         """
@@ -570,12 +579,10 @@ class SectionParser:
                 "liquidity", "capital resources", "revenue"
             ]
 
-        keyword_count = sum(
-            1 for keyword in mdna_keywords
-            if keyword.lower() in section_text.lower()
-        )
+        section_lower = section_text.lower()
+        has_keyword = any(keyword in section_lower for keyword in mdna_keywords)
 
-        if keyword_count < 1:  # More lenient for 10-Q
+        if not has_keyword:  # More lenient for 10-Q
             validation["warnings"].append(f"Few MD&A keywords found for {form_type}")
             if "10-K" in form_type:  # Only invalidate for 10-K
                 validation["is_valid"] = False
@@ -601,6 +608,7 @@ class SectionParser:
         ]
 
         subsections = []
+        line_index = _LineIndex(text)
 
         for pattern_str in subsection_patterns:
             pattern = re.compile(pattern_str, re.IGNORECASE | re.MULTILINE)
@@ -611,7 +619,7 @@ class SectionParser:
                     "title": match.group().strip(),
                     "start_pos": match.start(),
                     "end_pos": match.end(),
-                    "line_number": text[:match.start()].count('\n') + 1
+                    "line_number": line_index.line_number(match.start())
                 })
 
         # Sort by position
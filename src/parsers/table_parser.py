@@ -1,14 +1,118 @@
 """Improved parser for detecting and preserving tables within MD&A sections."""
 
 import re
-from typing import List, Dict, Tuple, Optional, Set
+from collections import defaultdict
+from functools import wraps
+from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 from config.patterns import COMPILED_PATTERNS
-from config.settings import TABLE_MIN_COLUMNS, TABLE_MIN_ROWS
+from config.settings import TABLE_MIN_COLUMNS, TABLE_MIN_ROWS, LINE_CACHE_SIZE
+from src.parsers.text_normalizer import has_column_gap, has_pipe_columns
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Each union below replaces several independent re.search calls over the
+# same line with a single scan. Only whether a line matches is used, so
+# patterns are written to avoid re-scanning long digit or whitespace runs
+# from every start position (quadratic on pathological lines)
+
+# Currency amounts, percentages, or parenthetical (negative) numbers
+_FINANCIAL_VALUE_RE = re.compile(
+    r'\$\s*[\d,]+(?:\.\d+)?(?:\s*(?:million|billion|thousand))?'
+    r'|(?<!\d)\d+(?:\.\d+)?\s*%'
+    r'|\(\s*[\d,]+(?:\.\d+)?\s*\)',
+    re.IGNORECASE
+)
+
+# Note markers, asterisk notes, total lines, and note references
+_NOTE_OR_TOTAL_RE = re.compile(
+    r'^\s*\([a-z0-9]\)'
+    r'|^\s*\*'
+    r'|(?:total|subtotal|net|gross)\s*(?::\s*)?\$?[\d,]'
+    r'|(?:see|refer\s+to)\s+(?:note|accompanying)',
+    re.IGNORECASE
+)
+
+# Leading note markers like (a), (1) or footnote asterisks
+_CONTINUATION_MARKER_RE = re.compile(r'\s*(?:\([a-z0-9]\)|\*)', re.IGNORECASE)
+
+# Period-ended or full-date column headers
+_DATE_HEADER_RE = re.compile(
+    r'(?:Year|Period|Quarter|Month)\s+End(?:ed|ing)'
+    r'|(?:December|June|March|September)\s+\d{1,2},?\s+20\d{2}',
+    re.IGNORECASE
+)
+
+# Financial statement table header cues
+_FINANCIAL_HEADER_RE = re.compile('|'.join([
+    # Equivalent for search() to an optional Consolidated/Condensed prefix
+    r'(?:Statements?|Schedule)\s*of',
+    r'(?:Year|Three|Six|Nine)\s+Months?\s+Ended',
+    r'(?:December|March|June|September)\s+\d{1,2},?\s+\d{4}',
+    r'(?:in\s+)?(?:millions|thousands|billions)(?:\s+of\s+dollars)?',
+    r'(?:Revenue|Income|Assets|Liabilities|Cash\s+Flow)',
+    r'(?:Balance\s+Sheet|Income\s+Statement|Statement\s+of\s+Operations)',
+]), re.IGNORECASE)
+
+# Four-digit years used as column headers
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+# Standalone numbers (not embedded in words) and any number-like run
+_STANDALONE_NUMBER_RE = re.compile(r'(?<!\w)[\d,]+(?:\.\d+)?(?!\w)')
+_NUMBER_RE = re.compile(r'[\d,]+(?:\.\d+)?')
+
+# Any (Unicode) decimal digit
+_DIGIT_RE = re.compile(r'\d')
+
+# Column separators: a whitespace gap or a single tab
+_COLUMN_SPLIT_RE = re.compile(r'\s{3,}|\t')
+
+# Keyword sets, searched against lowercased text as a single alternation
+_HEADER_KEYWORD_RE = re.compile('|'.join(map(re.escape, [
+    'total', 'year', 'quarter', 'revenue', 'income', 'assets',
+    'change', 'increase', 'decrease', '%', '$', '2019', '2020',
+    '2021', '2022', '2023', '2024', 'actual', 'budget'
+])))
+_CONTINUATION_KEYWORD_RE = re.compile('|'.join(map(re.escape, [
+    'total', 'subtotal', 'net', 'gross', 'sum',
+    'see note', 'see accompanying', 'continued',
+    'includes', 'excludes', 'consists of',
+    'represents', 'related to', 'primarily'
+])))
+
+# Words that mark a short preceding line as a table title
+_TITLE_INDICATORS = (
+    'table', 'schedule', 'summary', 'consolidated',
+    'condensed', 'statement', 'analysis'
+)
+
+
+def _memoize_by_line(predicate):
+    """
+    Cache a single-line predicate's result by line text.
+
+    The detection passes and the table extractors re-examine the same lines
+    (every failed extraction attempt rescans the lines that follow it), and
+    boilerplate lines recur across filings, so each distinct line is
+    classified once. Each predicate's cache holds at most LINE_CACHE_SIZE
+    lines and is cleared when full, even in the middle of a document.
+    """
+    name = predicate.__name__
+
+    @wraps(predicate)
+    def wrapper(self, line: str) -> bool:
+        cache = self._line_caches[name]
+        result = cache.get(line)
+        if result is None:
+            result = predicate(self, line)
+            if len(cache) >= LINE_CACHE_SIZE:
+                cache.clear()
+            cache[line] = result
+        return result
+
+    return wrapper
+
 
 @dataclass
 class Table:
@@ -21,15 +125,39 @@ class Table:
     title: Optional[str]
     confidence: float
     table_type: str  # 'delimited', 'aligned', 'mixed', 'financial'
-    original_text: str  # Preserve original formatting
+    original_text: Optional[str]  # Preserve original formatting (None: same as raw_lines)
     raw_lines: List[str]  # Raw lines for perfect preservation
 
 
+def _claim_lines(table_lines: bytearray, table: Table) -> None:
+    """Flag a table's lines as claimed with one slice assignment."""
+    span = table.end_line + 1 - table.start_line
+    table_lines[table.start_line:table.end_line + 1] = b'\x01' * span
+
+
 class TableParser:
     """Detects and preserves tables within text."""
 
     def __init__(self):
         self.patterns = COMPILED_PATTERNS
+        # Predicate results keyed by predicate name, then line text
+        self._line_caches: Dict[str, Dict[str, bool]] = defaultdict(dict)
+
+    def parse(self, text: str) -> Tuple[List[str], List[Table]]:
+        """
+        Split text into lines once and identify its tables.
+
+        The returned lines can be passed to preserve_tables_in_lines so the
+        text is not split a second time.
+
+        Args:
+            text: Text containing potential tables
+
+        Returns:
+            Tuple of (lines, tables)
+        """
+        lines = text.split('\n')
+        return lines, self._identify_from_lines(lines)
 
     def identify_tables(self, text: str) -> List[Table]:
         """
@@ -41,11 +169,14 @@ class TableParser:
         Returns:
             List of Table objects with position information
         """
+        return self._identify_from_lines(text.split('\n'))
+
+    def _identify_from_lines(self, lines: List[str]) -> List[Table]:
+        """Identify tables in text that has already been split into lines."""
         tables = []
-        lines = text.split('\n')
 
-        # Track which lines are part of tables
-        table_lines = set()
+        # Track which lines are part of tables (one flag byte per line)
+        table_lines = bytearray(len(lines))
 
         # Try different detection methods
         tables.extend(self._identify_financial_tables(lines, table_lines))
@@ -74,16 +205,26 @@ class TableParser:
         if not tables:
             return text
 
-        lines = text.split('\n')
+        return self.preserve_tables_in_lines(text.split('\n'), tables)
+
+    def preserve_tables_in_lines(self, lines: List[str], tables: List[Table]) -> str:
+        """
+        Same as preserve_tables_in_text, for text already split into lines.
+
+        Args:
+            lines: Lines of the original text (e.g. from parse)
+            tables: List of identified tables
+
+        Returns:
+            Text with tables properly formatted and preserved
+        """
         result_lines = []
         current_line = 0
 
         for table in sorted(tables, key=lambda t: t.start_line):
-            # Add lines before table
-            while current_line < table.start_line:
-                if current_line < len(lines):
-                    result_lines.append(lines[current_line])
-                current_line += 1
+            # Add lines before table (slices copy runs of lines in C)
+            if current_line < table.start_line:
+                result_lines.extend(lines[current_line:table.start_line])
 
             # Add table title if exists
             if table.title:
@@ -94,13 +235,13 @@ class TableParser:
             # Add the preserved table lines
             if hasattr(table, 'raw_lines') and table.raw_lines:
                 # Use the exact original lines
-                for raw_line in table.raw_lines:
-                    result_lines.append(raw_line)
+                result_lines.extend(table.raw_lines)
             else:
                 # Fallback to original_text
-                table_text_lines = table.original_text.split('\n')
-                for line in table_text_lines:
-                    result_lines.append(line)
+                original_text = table.original_text
+                if original_text is None:
+                    original_text = '\n'.join(table.raw_lines)
+                result_lines.extend(original_text.split('\n'))
 
             # Skip the original table lines in source
             current_line = table.end_line + 1
@@ -110,29 +251,32 @@ class TableParser:
                 result_lines.append("")  # Empty line after table
 
         # Add remaining lines
-        while current_line < len(lines):
-            result_lines.append(lines[current_line])
-            current_line += 1
+        result_lines.extend(lines[current_line:])
 
         return '\n'.join(result_lines)
 
-    def _identify_financial_tables(self, lines: List[str], table_lines: Set[int]) -> List[Table]:
+    def _identify_financial_tables(self, lines: List[str], table_lines: bytearray) -> List[Table]:
         """Specifically identify financial statement tables."""
         tables = []
         i = 0
-
-        while i < len(lines):
-            if i in table_lines:
-                i += 1
+        num_lines = len(lines)
+        # Bound methods hoisted out of the per-line loop
+        is_header = self._is_financial_table_header
+
+        while i < num_lines:
+            if table_lines[i]:
+                # Jump past the whole claimed run in one scan
+                i = table_lines.find(0, i)
+                if i == -1:
+                    break
                 continue
 
             # Look for financial table indicators
-            if self._is_financial_table_header(lines[i]):
+            if is_header(lines[i]):
                 table = self._extract_financial_table(lines, i, table_lines)
                 if table:
                     tables.append(table)
-                    for line_num in range(table.start_line, table.end_line + 1):
-                        table_lines.add(line_num)
+                    _claim_lines(table_lines, table)
                     i = table.end_line + 1
                 else:
                     i += 1
@@ -141,32 +285,22 @@ class TableParser:
 
         return tables
 
+    @_memoize_by_line
     def _is_financial_table_header(self, line: str) -> bool:
         """Check if line is a financial table header."""
         # Common financial table headers
-        financial_patterns = [
-            r'(?:Consolidated|Condensed)?\s*(?:Statements?|Schedule)\s*of',
-            r'(?:Year|Three|Six|Nine)\s+Months?\s+Ended',
-            r'(?:December|March|June|September)\s+\d{1,2},?\s+\d{4}',
-            r'(?:in\s+)?(?:millions|thousands|billions)(?:\s+of\s+dollars)?',
-            r'(?:Revenue|Income|Assets|Liabilities|Cash\s+Flow)',
-            r'(?:Balance\s+Sheet|Income\s+Statement|Statement\s+of\s+Operations)',
-        ]
-
-        for pattern in financial_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                return True
+        if _FINANCIAL_HEADER_RE.search(line):
+            return True
 
         # Check for date columns
-        date_pattern = r'\b(?:19|20)\d{2}\b'
-        dates = re.findall(date_pattern, line)
+        dates = _YEAR_RE.findall(line)
         if len(dates) >= 2:
             return True
 
         return False
 
     def _extract_financial_table(self, lines: List[str], start_idx: int,
-                                table_lines: Set[int]) -> Optional[Table]:
+                                table_lines: bytearray) -> Optional[Table]:
         """Extract a financial table with special handling."""
         table_start = start_idx
         table_raw_lines = []
@@ -183,31 +317,34 @@ class TableParser:
         current = start_idx
         consecutive_empty = 0
         has_numeric_data = False
+        num_lines = len(lines)
+        is_table_line = self._is_table_line
+        is_continuation = self._is_table_continuation
+        append = table_raw_lines.append
 
-        while current < len(lines):
+        while current < num_lines:
             line = lines[current]
 
             if not line.strip():
                 consecutive_empty += 1
                 if consecutive_empty > 2:
                     break
-                table_raw_lines.append(line)
+                append(line)
             else:
                 consecutive_empty = 0
 
-                # Check if line contains numeric data
-                if re.search(r'\d', line):
+                # Check if line contains numeric data (once found, stop looking)
+                if not has_numeric_data and _DIGIT_RE.search(line):
                     has_numeric_data = True
 
                 # Check if line looks like part of table
-                if (self._is_table_line(line) or
-                    self._is_financial_data_line(line) or
-                    self._is_table_continuation(line)):
-                    table_raw_lines.append(line)
+                # (_is_table_line already covers financial data lines)
+                if is_table_line(line) or is_continuation(line):
+                    append(line)
                 else:
                     # Check if it's a note or total line
                     if self._is_table_note_or_total(line):
-                        table_raw_lines.append(line)
+                        append(line)
                     else:
                         break
 
@@ -219,6 +356,7 @@ class TableParser:
 
         # Create table object
         table_end = start_idx + len(table_raw_lines) - 1
+        raw_lines = lines[table_start:table_end + 1]
 
         return Table(
             content=[],  # Will be filled if needed
@@ -229,27 +367,19 @@ class TableParser:
             title=title,
             confidence=0.95,
             table_type='financial',
-            original_text='\n'.join(lines[table_start:table_end + 1]),
-            raw_lines=lines[table_start:table_end + 1]
+            original_text=None,  # raw_lines already holds the text
+            raw_lines=raw_lines
         )
 
     def _is_financial_data_line(self, line: str) -> bool:
         """Check if line contains financial data."""
-        # Look for currency amounts
-        currency_pattern = r'\$\s*[\d,]+(?:\.\d+)?(?:\s*(?:million|billion|thousand))?'
-        if re.search(currency_pattern, line, re.IGNORECASE):
-            return True
-
-        # Look for percentages
-        if re.search(r'\d+(?:\.\d+)?\s*%', line):
-            return True
-
-        # Look for parenthetical numbers (negative values)
-        if re.search(r'\(\s*[\d,]+(?:\.\d+)?\s*\)', line):
+        # Look for currency amounts, percentages, or parenthetical numbers
+        # (each needs a literal '$', '%' or '(', so test for those first)
+        if ('$' in line or '%' in line or '(' in line) and _FINANCIAL_VALUE_RE.search(line):
             return True
 
         # Look for columnar numeric data
-        numbers = re.findall(r'(?<!\w)[\d,]+(?:\.\d+)?(?!\w)', line)
+        numbers = _STANDALONE_NUMBER_RE.findall(line)
         if len(numbers) >= 2:
             # Check if numbers are spaced apart
             first_num_pos = line.find(numbers[0])
@@ -259,50 +389,43 @@ class TableParser:
 
         return False
 
+    @_memoize_by_line
     def _is_table_note_or_total(self, line: str) -> bool:
         """Check if line is a table note or total line."""
-        note_total_patterns = [
-            r'^\s*\([a-z0-9]\)',  # (a), (1), etc.
-            r'^\s*\*',  # Asterisk notes
-            r'(?:total|subtotal|net|gross)\s*:?\s*\$?[\d,]',
-            r'(?:see|refer\s+to)\s+(?:note|accompanying)',
-        ]
-
-        for pattern in note_total_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                return True
+        return _NOTE_OR_TOTAL_RE.search(line) is not None
 
-        return False
-
-    def _identify_delimited_tables(self, lines: List[str], table_lines: Set[int]) -> List[Table]:
+    def _identify_delimited_tables(self, lines: List[str], table_lines: bytearray) -> List[Table]:
         """Identify tables with clear delimiters."""
         tables = []
         i = 0
+        num_lines = len(lines)
+        is_delimiter = self._is_horizontal_delimiter
 
-        while i < len(lines):
+        while i < num_lines:
             # Skip lines already identified as part of tables
-            if i in table_lines:
-                i += 1
+            if table_lines[i]:
+                # Jump past the whole claimed run in one scan
+                i = table_lines.find(0, i)
+                if i == -1:
+                    break
                 continue
 
             # Check for horizontal delimiter
-            if self._is_horizontal_delimiter(lines[i]):
+            if is_delimiter(lines[i]):
                 table = self._extract_delimited_table(lines, i, table_lines)
                 if table:
                     tables.append(table)
                     # Mark lines as part of table
-                    for line_num in range(table.start_line, table.end_line + 1):
-                        table_lines.add(line_num)
+                    _claim_lines(table_lines, table)
                     i = table.end_line + 1
                 else:
                     i += 1
             # Check for pipe-delimited table
-            elif '|' in lines[i] and lines[i].count('|') >= 2:
+            elif has_pipe_columns(lines[i]):
                 table = self._extract_pipe_table(lines, i, table_lines)
                 if table:
                     tables.append(table)
-                    for line_num in range(table.start_line, table.end_line + 1):
-                        table_lines.add(line_num)
+                    _claim_lines(table_lines, table)
                     i = table.end_line + 1
                 else:
                     i += 1
@@ -311,24 +434,28 @@ class TableParser:
 
         return tables
 
-    def _identify_aligned_tables(self, lines: List[str], table_lines: Set[int]) -> List[Table]:
+    def _identify_aligned_tables(self, lines: List[str], table_lines: bytearray) -> List[Table]:
         """Identify space-aligned tables."""
         tables = []
         i = 0
+        num_lines = len(lines)
+        is_header = self._looks_like_table_header
 
-        while i < len(lines):
+        while i < num_lines:
             # Skip lines already identified as part of tables
-            if i in table_lines:
-                i += 1
+            if table_lines[i]:
+                # Jump past the whole claimed run in one scan
+                i = table_lines.find(0, i)
+                if i == -1:
+                    break
                 continue
 
             # Look for potential table headers
-            if self._looks_like_table_header(lines[i]):
+            if is_header(lines[i]):
                 table = self._extract_aligned_table(lines, i, table_lines)
                 if table:
                     tables.append(table)
-                    for line_num in range(table.start_line, table.end_line + 1):
-                        table_lines.add(line_num)
+                    _claim_lines(table_lines, table)
                     i = table.end_line + 1
                 else:
                     i += 1
@@ -337,38 +464,35 @@ class TableParser:
 
         return tables
 
+    @_memoize_by_line
     def _is_horizontal_delimiter(self, line: str) -> bool:
         """Check if line is a horizontal delimiter."""
         stripped = line.strip()
         if len(stripped) < 3:
             return False
 
-        # Check for lines made of dashes, equals, or underscores
-        delimiter_chars = {'-', '=', '_'}
-        unique_chars = set(stripped.replace(' ', ''))
-
-        return len(unique_chars) == 1 and unique_chars.issubset(delimiter_chars)
+        # Check for lines made of one of dashes, equals, or underscores
+        # (optionally spaced out); stripped[0] is the only candidate
+        delimiter = stripped[0]
+        return delimiter in '-=_' and not stripped.replace(delimiter, '').replace(' ', '')
 
+    @_memoize_by_line
     def _is_table_line(self, line: str) -> bool:
         """Check if a line appears to be part of a table."""
+        # The stripped line starts and ends with content, so any separator
+        # inside it yields at least two non-empty segments; no need to split
+        stripped = line.strip()
+
         # Has multiple segments separated by significant spaces
-        if re.search(r'\s{3,}', line):
-            segments = re.split(r'\s{3,}', line.strip())
-            if len(segments) >= 2:
-                # Check if at least some segments have content
-                non_empty = [s for s in segments if s.strip()]
-                if len(non_empty) >= 2:
-                    return True
+        if has_column_gap(stripped):
+            return True
 
         # Has tabs (often used in tables)
-        if '\t' in line and line.count('\t') >= 1:
-            segments = line.split('\t')
-            non_empty = [s for s in segments if s.strip()]
-            if len(non_empty) >= 2:
-                return True
+        if '\t' in stripped:
+            return True
 
         # Has pipe delimiters
-        if '|' in line and line.count('|') >= 2:
+        if has_pipe_columns(line):
             return True
 
         # Is a delimiter line
@@ -381,31 +505,30 @@ class TableParser:
 
         return False
 
+    @_memoize_by_line
     def _looks_like_table_header(self, line: str) -> bool:
         """Check if line looks like a table header."""
-        # Check for date headers
-        if re.search(r'(?:Year|Period|Quarter|Month)\s+End(?:ed|ing)', line, re.IGNORECASE):
-            return True
-
-        # Check for financial statement headers
-        if re.search(r'(?:December|June|March|September)\s+\d{1,2},?\s+20\d{2}', line, re.IGNORECASE):
+        # Check for date headers and financial statement headers
+        if _DATE_HEADER_RE.search(line):
             return True
 
         # Check for columnar structure with common headers
-        segments = re.split(r'\s{3,}|\t', line.strip())
+        stripped = line.strip()
+        if '\t' in line or has_column_gap(line):
+            # Only the count matters, so stop once there are enough columns
+            segments = _COLUMN_SPLIT_RE.split(stripped, TABLE_MIN_COLUMNS - 1)
+        else:
+            segments = [stripped]
         if len(segments) >= TABLE_MIN_COLUMNS:
-            header_keywords = ['total', 'year', 'quarter', 'revenue', 'income', 'assets',
-                             'change', 'increase', 'decrease', '%', '$', '2019', '2020',
-                             '2021', '2022', '2023', '2024', 'actual', 'budget']
-            matches = sum(1 for seg in segments
-                         if any(keyword in seg.lower() for keyword in header_keywords))
-            if matches >= 1:
+            # Keywords contain no whitespace, so a hit in the whole line
+            # is a hit in one of its segments
+            if _HEADER_KEYWORD_RE.search(stripped.lower()):
                 return True
 
         return False
 
     def _extract_delimited_table(self, lines: List[str], delimiter_line: int,
-                                table_lines: Set[int]) -> Optional[Table]:
+                                table_lines: bytearray) -> Optional[Table]:
         """Extract a table with horizontal delimiter."""
         # Look for header above delimiter
         if delimiter_line > 0 and not lines[delimiter_line - 1].strip():
@@ -461,12 +584,12 @@ class TableParser:
             title=title,
             confidence=0.9,
             table_type='delimited',
-            original_text='\n'.join(table_raw_lines),
-            raw_lines=lines[table_start:end_line + 1]
+            original_text=None,  # raw_lines already holds the text
+            raw_lines=table_raw_lines  # the contiguous run table_start..end_line
         )
 
     def _extract_pipe_table(self, lines: List[str], start_line: int,
-                           table_lines: Set[int]) -> Optional[Table]:
+                           table_lines: bytearray) -> Optional[Table]:
         """Extract a pipe-delimited table."""
         table_raw_lines = []
         current_line = start_line
@@ -502,39 +625,42 @@ class TableParser:
             title=title,
             confidence=0.95,
             table_type='delimited',
-            original_text='\n'.join(table_raw_lines),
-            raw_lines=lines[start_line:end_line + 1]
+            original_text=None,  # raw_lines already holds the text
+            raw_lines=table_raw_lines  # the contiguous run start_line..end_line
         )
 
     def _extract_aligned_table(self, lines: List[str], start_line: int,
-                              table_lines: Set[int]) -> Optional[Table]:
+                              table_lines: bytearray) -> Optional[Table]:
         """Extract a space-aligned table."""
         table_raw_lines = [lines[start_line]]  # Start with header
         current_line = start_line + 1
         consecutive_empty = 0
         has_numeric_data = False
+        num_lines = len(lines)
+        is_table_line = self._is_table_line
+        is_continuation = self._is_table_continuation
+        append = table_raw_lines.append
 
-        while current_line < len(lines) and consecutive_empty < 2:
+        while current_line < num_lines and consecutive_empty < 2:
             line = lines[current_line]
 
             if not line.strip():
                 consecutive_empty += 1
                 if consecutive_empty == 1:
-                    table_raw_lines.append(line)
+                    append(line)
                 current_line += 1
                 continue
             else:
                 consecutive_empty = 0
 
-            # Check for numeric data
-            if re.search(r'\d', line):
+            # Check for numeric data (once found, stop looking)
+            if not has_numeric_data and _DIGIT_RE.search(line):
                 has_numeric_data = True
 
             # Check if line looks like table data
-            if (self._is_table_line(line) or
-                self._is_financial_data_line(line) or
-                self._is_table_continuation(line)):
-                table_raw_lines.append(line)
+            # (_is_table_line already covers financial data lines)
+            if is_table_line(line) or is_continuation(line):
+                append(line)
             else:
                 break
 
@@ -559,54 +685,40 @@ class TableParser:
             title=title,
             confidence=0.8,
             table_type='aligned',
-            original_text='\n'.join(table_raw_lines),
-            raw_lines=lines[start_line:end_line + 1]
+            original_text=None,  # raw_lines already holds the text
+            raw_lines=table_raw_lines  # the contiguous run start_line..end_line
         )
 
+    @_memoize_by_line
     def _looks_like_table_data(self, line: str) -> bool:
         """Check if line looks like table data."""
         # Contains numbers
-        if re.search(r'\d', line):
+        if _DIGIT_RE.search(line):
             # Check for multiple numbers separated by spaces
-            numbers = re.findall(r'[\d,]+(?:\.\d+)?', line)
+            numbers = _NUMBER_RE.findall(line)
             if len(numbers) >= 2:
                 return True
             # Single number might be OK if it's financial data
             if self._is_financial_data_line(line):
                 return True
 
-        # Has columnar structure
-        if re.search(r'\s{3,}|\t', line):
-            segments = re.split(r'\s{3,}|\t', line.strip())
-            non_empty = [s for s in segments if s.strip()]
-            if len(non_empty) >= 2:
-                return True
+        # Has columnar structure (a separator inside the stripped line means
+        # at least two non-empty segments)
+        stripped = line.strip()
+        if '\t' in stripped or has_column_gap(stripped):
+            return True
 
         return False
 
+    @_memoize_by_line
     def _is_table_continuation(self, line: str) -> bool:
         """Check if line is a table continuation (like totals, notes)."""
-        continuation_keywords = [
-            'total', 'subtotal', 'net', 'gross', 'sum',
-            'see note', 'see accompanying', 'continued',
-            'includes', 'excludes', 'consists of',
-            'represents', 'related to', 'primarily'
-        ]
-        line_lower = line.lower()
-
         # Check for keywords
-        if any(keyword in line_lower for keyword in continuation_keywords):
+        if _CONTINUATION_KEYWORD_RE.search(line.lower()):
             return True
 
-        # Check for note markers
-        if re.match(r'^\s*\([a-z0-9]\)', line, re.IGNORECASE):
-            return True
-
-        # Check for footnote markers
-        if re.match(r'^\s*\*+\s*', line):
-            return True
-
-        return False
+        # Check for note and footnote markers
+        return _CONTINUATION_MARKER_RE.match(line) is not None
 
     def _extract_table_title(self, lines: List[str], table_start: int) -> Optional[str]:
         """Extract table title from preceding lines."""
@@ -622,24 +734,19 @@ class TableParser:
             if not line:
                 continue
 
-            # Check if it looks like a title
+            # Check if it looks like a title (cheap shape checks first)
             if (len(line) < 200 and
-                not self._is_table_line(line) and
-                not self._is_financial_data_line(line) and
                 not line.endswith('.') and
-                not re.match(r'^\d+$', line)):  # Not just a number
+                not line.isdecimal() and  # Not just a number
+                not self._is_table_line(line)):
 
-                # Additional title indicators
-                title_indicators = [
-                    'table', 'schedule', 'summary', 'consolidated',
-                    'condensed', 'statement', 'analysis'
-                ]
-
-                if any(ind in line.lower() for ind in title_indicators):
+                # A reasonable length is enough; shorter lines need a
+                # title indicator
+                if len(line) > 10:
                     return line
 
-                # Even without indicators, might still be a title
-                if len(line) > 10:  # Reasonable length
+                line_lower = line.lower()
+                if any(ind in line_lower for ind in _TITLE_INDICATORS):
                     return line
 
         return None
@@ -653,20 +760,28 @@ class TableParser:
         tables.sort(key=lambda t: t.start_line)
 
         deduped = []
+        # Kept tables that may still contain a later start line, in deduped
+        # order. Starts only increase, so a kept table ending before the
+        # current start can never overlap again and is dropped from the front.
+        active = []
         for table in tables:
-            # Check if overlaps with existing tables
-            overlap = False
-            for existing in deduped:
-                if (table.start_line >= existing.start_line and
-                    table.start_line <= existing.end_line):
-                    # Check confidence - keep higher confidence table
-                    if table.confidence > existing.confidence:
-                        deduped.remove(existing)
-                        deduped.append(table)
-                    overlap = True
-                    break
-
-            if not overlap:
+            expired = 0
+            while expired < len(active) and active[expired].end_line < table.start_line:
+                expired += 1
+            del active[:expired]
+
+            # Check if overlaps with existing tables (the first kept table
+            # that contains this start line)
+            if active:
+                existing = active[0]
+                # Check confidence - keep higher confidence table
+                if table.confidence > existing.confidence:
+                    deduped.remove(existing)
+                    deduped.append(table)
+                    del active[0]
+                    active.append(table)
+            else:
                 deduped.append(table)
+                active.append(table)
 
         return deduped
\ No newline at end of file
@@ -4,16 +4,147 @@ import re
 import unicodedata
 
 from typing import List, Set, Tuple
-from config.patterns import COMPILED_PATTERNS
 from config.settings import CONTROL_CHAR_REPLACEMENT, MULTIPLE_WHITESPACE_PATTERN
 
+# Deletes table delimiter characters (-, =, _) via str.translate
+_DELIMITER_CHARS = str.maketrans('', '', '-=_')
+
+# Control characters other than \t, \n and \r
+_CONTROL_CHAR_RE = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F-\x9F]')
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F]+')
+
+# SEC markers: page markers, "Table of Contents" headers, standalone page
+# numbers and HTML-like tags. The line patterns only skip indentation within
+# their own line; see _remove_line_matches for the blank lines before them
+_PAGE_MARKER_RE = re.compile(r'<PAGE>\s*\d+', re.IGNORECASE)
+_TOC_HEADER_RE = re.compile(r'^[^\S\n]*(Table\s+of\s+Contents\s*$)', re.MULTILINE | re.IGNORECASE)
+_PAGE_NUMBER_LINE_RE = re.compile(r'^[^\S\n]*(\d{1,3}\s*$)', re.MULTILINE)
+_SEC_TAG_RE = re.compile(r'</?[A-Z]+>')
+
+# Whitespace runs: spaces and tabs only, or any whitespace
+_HORIZONTAL_SPACE_RE = re.compile(r'[ \t]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Maps characters that are illegal in filenames to spaces
+_ILLEGAL_FILENAME_CHARS = str.maketrans(dict.fromkeys('/\\:*?"<>|\n\r\t', ' '))
+
+# Common patterns for company name in SEC filings
+_COMPANY_NAME_RES = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+        r"(?:COMPANY\s*CONFORMED\s*NAME|CONFORMED\s*NAME|COMPANY\s*NAME)[\s:]+([^\n]+)",
+        r"(?:^|\n)\s*([A-Z][A-Z0-9\s,.\-&]+(?:INC|CORP|LLC|LP|LTD|COMPANY|CO)\.?)\s*\n",
+        r"(?:REGISTRANT\s*NAME)[\s:]+([^\n]+)",
+    )
+]
+
+# Common unicode characters and their ASCII equivalents. Replaced one at a
+# time: str.replace skips absent characters at memchr speed, where a
+# translate table is applied per character and is far slower on long text
+_UNICODE_REPLACEMENTS = {
+    '\u2019': "'",  # Right single quotation mark
+    '\u2018': "'",  # Left single quotation mark
+    '\u201C': '"',  # Left double quotation mark
+    '\u201D': '"',  # Right double quotation mark
+    '\u2013': '-',  # En dash
+    '\u2014': '--', # Em dash (use double dash to preserve width)
+    '\u2026': '...',  # Ellipsis
+    '\u00A0': ' ',  # Non-breaking space
+    '\u2022': '*',  # Bullet
+    '\u00B7': '*',  # Middle dot
+    '\u2212': '-',  # Minus sign
+}
+
+# Mojibake fixes, applied as one alternation per stage. Order matters
+# between stages: dropping a stray 'Ã¢' or 'Â' can join the pieces of a
+# later 'â\x80..' sequence, which the last stage then fixes
+_MOJIBAKE_STAGES = [
+    (re.compile('|'.join(map(re.escape, sorted(fixes, key=len, reverse=True)))), fixes)
+    for fixes in (
+        {
+            'â€™': "'",
+            'â€œ': '"',
+            'â€': '"',
+        },
+        {
+            'Ã¢': '',
+            'Â': '',
+        },
+        {
+            'â\x80\x99': "'",
+            'â\x80\x9c': '"',
+            'â\x80\x9d': '"',
+            'â\x80\x93': '-',
+            'â\x80\x94': '--',
+        },
+    )
+]
+
+# Financial numbers, with or without currency symbols or unit suffixes. The
+# lookahead names every possible first character, so the engine skips ahead
+# to candidates instead of trying the optional prefixes at each position
+_COLUMN_NUMBER_RE = re.compile(r'(?=[$(\d,])(?:\$\s*)?\(?[\d,]+(?:\.\d+)?\)?(?:\s*[%KMB])?')
+# Every financial number contains one of these; prose lines usually don't
+_NUMBER_CHAR_RE = re.compile(r'[\d,]')
+
+# Column gap: a run of three or more whitespace characters
+COLUMN_GAP_RE = re.compile(r'\s{3,}')
+
+
+def has_column_gap(line: str) -> bool:
+    """
+    Equivalent of COLUMN_GAP_RE.search(line) without the regex for most lines.
+
+    The ASCII space is the only printable whitespace character, so a printable
+    line without three consecutive spaces cannot contain a gap.
+    """
+    if '   ' in line:
+        return True
+    if line.isprintable():
+        return False
+    return COLUMN_GAP_RE.search(line) is not None
+
+
+def has_pipe_columns(line: str) -> bool:
+    """
+    Equivalent of line.count('|') >= 2, scanning only as far as the second pipe.
+    """
+    first = line.find('|')
+    return first != -1 and line.find('|', first + 1) != -1
+
+
+def _remove_line_matches(pattern: re.Pattern, text: str) -> str:
+    r"""
+    Equivalent of re.sub(r'^\s*' + body, '', text, flags=re.MULTILINE).
+
+    With a leading ^\s* the engine retries at every line start of a blank
+    run and rescans the rest of it each time, which is quadratic in the run
+    length. pattern matches the body from its own line start instead, and
+    each match is widened back to the first line start of the whitespace
+    before it, where the ^\s* match would have begun.
+    """
+    pieces = []
+    last = 0
+    for match in pattern.finditer(text):
+        start = match.start(1)
+        while start > last and text[start - 1].isspace():
+            start -= 1
+        if start and text[start - 1] != '\n':
+            start = text.find('\n', start) + 1
+        pieces.append(text[last:start])
+        last = match.end()
+
+    if not pieces:
+        return text
+    pieces.append(text[last:])
+    return ''.join(pieces)
+
 
 class TextNormalizer:
     """Handles text cleaning and normalization for SEC filings while preserving document structure."""
 
-    def __init__(self):
-        self.control_char_pattern = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F-\x9F]')  # Preserve \t, \n, \r
-        self.non_ascii_pattern = re.compile(r'[^\x00-\x7F]+')
+    # Shared by all instances, compiled once per process
+    control_char_pattern = _CONTROL_CHAR_RE
+    non_ascii_pattern = _NON_ASCII_RE
 
     def normalize_text(self, text: str, preserve_structure: bool = True) -> str:
         """
@@ -57,53 +188,54 @@ class TextNormalizer:
         """
         lines = text.split('\n')
         processed_lines = []
+        # Bound methods hoisted out of the per-line loop
+        is_structured = self._is_structured_line
+        append = processed_lines.append
+        # Whether the last kept line has content
+        after_content = False
 
         for line in lines:
             # Preserve lines that appear to be part of tables or columnar data
-            if self._is_structured_line(line):
+            if is_structured(line):
                 # Keep original spacing for structured content
-                processed_lines.append(line.rstrip())  # Remove only trailing spaces
+                append(line.rstrip())  # Remove only trailing spaces
+                after_content = True
             else:
-                # For regular text, normalize internal spacing but preserve indentation
-                indent = len(line) - len(line.lstrip())
+                # For regular text, normalize internal spacing but preserve
+                # indentation (capped at 4, so only the first 4 chars matter)
                 cleaned = ' '.join(line.split())
                 if cleaned:
-                    processed_lines.append(' ' * min(indent, 4) + cleaned)
-                elif processed_lines and processed_lines[-1].strip():
+                    head = line[:4]
+                    append(' ' * (len(head) - len(head.lstrip())) + cleaned)
+                    after_content = True
+                elif after_content:
                     # Keep one empty line between paragraphs
-                    processed_lines.append('')
-
-        # Clean up multiple consecutive empty lines
-        result = []
-        empty_count = 0
-        for line in processed_lines:
-            if not line.strip():
-                empty_count += 1
-                if empty_count <= 2:  # Allow up to 2 consecutive empty lines
-                    result.append(line)
-            else:
-                empty_count = 0
-                result.append(line)
+                    append('')
+                    after_content = False
 
-        return '\n'.join(result)
+        # Structured lines always have content and an empty line is only
+        # added after a non-empty one, so there are never consecutive empty
+        # lines to collapse and the list can be joined directly
+        return '\n'.join(processed_lines)
 
     def _is_structured_line(self, line: str) -> bool:
         """
         Determine if a line is part of structured content (table, columnar data).
         """
-        # Check for table delimiters
-        if re.match(r'^\s*[-=_]{3,}\s*$', line):
+        # Check for table delimiters (a line of 3+ '-', '=' or '_'); the
+        # first-character test keeps translate from copying ordinary lines
+        stripped = line.strip()
+        if (len(stripped) >= 3 and stripped[0] in '-=_'
+                and not stripped.translate(_DELIMITER_CHARS)):
             return True
 
-        # Check for multiple consecutive spaces (columnar data)
-        if re.search(r'\s{3,}', line):
-            # Count segments separated by multiple spaces
-            segments = re.split(r'\s{3,}', line.strip())
-            if len(segments) >= 2 and any(s.strip() for s in segments):
-                return True
+        # Check for multiple consecutive spaces (columnar data); a gap inside
+        # the stripped line always separates two non-empty segments
+        if has_column_gap(stripped):
+            return True
 
         # Check for pipe-delimited content
-        if '|' in line and line.count('|') >= 2:
+        if has_pipe_columns(line):
             return True
 
         # Check for numeric data in columns
@@ -114,32 +246,33 @@ class TextNormalizer:
 
     def _has_columnar_numbers(self, line: str) -> bool:
         """Check if line contains numbers in a columnar format."""
-        # Pattern for financial numbers (with or without currency symbols)
-        number_pattern = re.compile(r'(?:\$\s*)?\(?[\d,]+(?:\.\d+)?\)?(?:\s*[%KMB])?')
-        matches = list(number_pattern.finditer(line))
-
-        if len(matches) >= 2:
-            # Check if numbers are spaced out (suggesting columns)
-            positions = [m.start() for m in matches]
-            for i in range(1, len(positions)):
-                if positions[i] - positions[i-1] > 10:  # Arbitrary spacing threshold
-                    return True
+        if not _NUMBER_CHAR_RE.search(line):
+            return False
+
+        # Check if consecutive numbers are spaced out (suggesting columns),
+        # stopping at the first wide gap
+        previous = None
+        for match in _COLUMN_NUMBER_RE.finditer(line):
+            position = match.start()
+            if previous is not None and position - previous > 10:  # Arbitrary spacing threshold
+                return True
+            previous = position
 
         return False
 
     def _remove_sec_markers(self, text: str) -> str:
         """Remove SEC-specific markers while preserving document structure."""
         # Remove page markers
-        text = re.sub(r'<PAGE>\s*\d+', '', text, flags=re.IGNORECASE)
+        text = _PAGE_MARKER_RE.sub('', text)
 
         # Remove "Table of Contents" headers but keep the structure
-        text = re.sub(r'^\s*Table\s+of\s+Contents\s*$', '', text, flags=re.MULTILINE | re.IGNORECASE)
+        text = _remove_line_matches(_TOC_HEADER_RE, text)
 
         # Remove standalone page numbers at line start/end
-        text = re.sub(r'^\s*\d{1,3}\s*$', '', text, flags=re.MULTILINE)
+        text = _remove_line_matches(_PAGE_NUMBER_LINE_RE, text)
 
         # Remove HTML-like tags
-        text = re.sub(r'</?[A-Z]+>', '', text)
+        text = _SEC_TAG_RE.sub('', text)
 
         return text
 
@@ -149,56 +282,35 @@ class TextNormalizer:
 
     def _normalize_unicode(self, text: str) -> str:
         """Normalize unicode characters to ASCII equivalents where possible."""
+        # ASCII text is already NFKD and has none of the characters below
+        if text.isascii():
+            return text
+
         # Normalize to NFKD form
         text = unicodedata.normalize('NFKD', text)
 
         # Replace common unicode characters
-        replacements = {
-            '\u2019': "'",  # Right single quotation mark
-            '\u2018': "'",  # Left single quotation mark
-            '\u201C': '"',  # Left double quotation mark
-            '\u201D': '"',  # Right double quotation mark
-            '\u2013': '-',  # En dash
-            '\u2014': '--', # Em dash (use double dash to preserve width)
-            '\u2026': '...',  # Ellipsis
-            '\u00A0': ' ',  # Non-breaking space
-            '\u2022': '*',  # Bullet
-            '\u00B7': '*',  # Middle dot
-            '\u2212': '-',  # Minus sign
-        }
-
-        for unicode_char, ascii_char in replacements.items():
+        for unicode_char, ascii_char in _UNICODE_REPLACEMENTS.items():
             text = text.replace(unicode_char, ascii_char)
 
         return text
 
     def _fix_encoding_issues(self, text: str) -> str:
         """Fix common encoding issues in text."""
-        # Fix mojibake patterns
-        encoding_fixes = {
-            'â€™': "'",
-            'â€œ': '"',
-            'â€': '"',
-            'â€"': '--',
-            'â€"': '-',
-            'Ã¢': '',
-            'Â': '',
-            'â\x80\x99': "'",
-            'â\x80\x9c': '"',
-            'â\x80\x9d': '"',
-            'â\x80\x93': '-',
-            'â\x80\x94': '--',
-        }
+        # Every mojibake sequence starts with one of these characters
+        if 'â' not in text and 'Ã' not in text and 'Â' not in text:
+            return text
 
-        for pattern, replacement in encoding_fixes.items():
-            text = text.replace(pattern, replacement)
+        # One pass per stage; the stages stay in order (see _MOJIBAKE_STAGES)
+        for pattern, fixes in _MOJIBAKE_STAGES:
+            text = pattern.sub(lambda match: fixes[match.group()], text)
 
         return text
 
     def _normalize_whitespace(self, text: str) -> str:
         """Normalize multiple whitespace to single spaces."""
         # Replace multiple spaces, tabs, etc. with single space
-        text = re.sub(r'[ \t]+', ' ', text)
+        text = _HORIZONTAL_SPACE_RE.sub(' ', text)
 
         # Normalize line endings
         text = text.replace('\r\n', '\n').replace('\r', '\n')
@@ -209,13 +321,19 @@ class TextNormalizer:
         """Remove excessive empty lines while preserving paragraph structure."""
         lines = text.split('\n')
         non_empty_lines = []
+        append = non_empty_lines.append
+        # Whether the last kept line has content (kept lines are either
+        # non-blank or a single separating '')
+        after_content = False
 
         for line in lines:
             if line.strip():
-                non_empty_lines.append(line)
-            elif non_empty_lines and non_empty_lines[-1].strip():
+                append(line)
+                after_content = True
+            elif after_content:
                 # Keep one empty line between paragraphs
-                non_empty_lines.append('')
+                append('')
+                after_content = False
 
         return '\n'.join(non_empty_lines)
 
@@ -231,7 +349,7 @@ class TextNormalizer:
         """
         # Remove newlines and extra spaces
         text = text.replace('\n', ' ').replace('\r', ' ')
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
 
         # Escape quotes
         text = text.replace('"', '""')
@@ -248,19 +366,14 @@ class TextNormalizer:
         Returns:
             Company name or empty string
         """
-        # Common patterns for company name in SEC filings
-        patterns = [
-            r"(?:COMPANY\s*CONFORMED\s*NAME|CONFORMED\s*NAME|COMPANY\s*NAME)[\s:]+([^\n]+)",
-            r"(?:^|\n)\s*([A-Z][A-Z0-9\s,.\-&]+(?:INC|CORP|LLC|LP|LTD|COMPANY|CO)\.?)\s*\n",
-            r"(?:REGISTRANT\s*NAME)[\s:]+([^\n]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text[:5000], re.IGNORECASE | re.MULTILINE)
+        header = text[:5000]
+
+        for pattern in _COMPANY_NAME_RES:
+            match = pattern.search(header)
             if match:
                 company_name = match.group(1).strip()
                 # Clean up the name
-                company_name = re.sub(r'\s+', ' ', company_name)
+                company_name = _WHITESPACE_RE.sub(' ', company_name)
                 company_name = company_name.strip(' .')
                 if len(company_name) > 3 and len(company_name) < 100:
                     return company_name
@@ -278,12 +391,10 @@ class TextNormalizer:
             Sanitized string safe for filenames
         """
         # Replace illegal filename characters
-        illegal_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|', '\n', '\r', '\t']
-        for char in illegal_chars:
-            name = name.replace(char, ' ')
+        name = name.translate(_ILLEGAL_FILENAME_CHARS)
 
         # Replace multiple spaces with single space
-        name = re.sub(r'\s+', ' ', name)
+        name = _WHITESPACE_RE.sub(' ', name)
 
         # Remove leading/trailing spaces and periods
         name = name.strip(' .')
@@ -117,6 +117,9 @@ def log_summary(stats: dict) -> None:
     if "failed" in stats:
         logger.info(f"Failed: {stats['failed']}")
 
+    if stats.get("not_processed", 0) > 0:
+        logger.warning(f"Not processed: {stats['not_processed']}")
+
     if stats.get("failed", 0) > 0:
         logger.warning(f"Check {ERROR_LOG_PATH} for details on failures")
 
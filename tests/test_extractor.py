@@ -1,3 +1,4 @@
+import os
 import pytest
 from pathlib import Path
 from datetime import datetime
@@ -8,6 +9,31 @@ from src.models.filing import Filing, ExtractionResult
 from src.utils.logger import setup_logging
 
 
+class RaisingExtractor(MDNAExtractor):
+    """Extractor whose every file raises; module level so workers can unpickle it."""
+
+    def extract_from_file(self, file_path):
+        raise RuntimeError("boom")
+
+
+class ExitingExtractor(MDNAExtractor):
+    """Extractor whose worker process dies on the first file, breaking the pool."""
+
+    def extract_from_file(self, file_path):
+        os._exit(1)
+
+
+class TaggedExtractor(MDNAExtractor):
+    """Extractor with an extra constructor argument that workers must receive."""
+
+    def __init__(self, output_dir, tag):
+        super().__init__(output_dir)
+        self.tag = tag
+
+    def _worker_init_args(self):
+        return {"output_dir": self.output_dir, "tag": self.tag}
+
+
 class TestMDNAExtractor:
     """Test suite for MDNAExtractor and 10-Q fallback logic."""
 
@@ -88,3 +114,63 @@ ITEM 3. QUANTITATIVE AND QUALITATIVE DISCLOSURES ABOUT MARKET RISK
 
         assert stats["combined"]["processed"] == 1
         assert stats["combined"]["skipped_10q"] == 0
+
+    def _write_filings(self, input_dir, sample_10k_content):
+        input_dir.mkdir()
+        for cik in ("0001234567", "0007654321", "0001111111"):
+            content = sample_10k_content.replace("0001234567", cik)
+            (input_dir / f"{cik}_20240315_10-K.txt").write_text(content)
+
+    def _read_outputs(self, output_dir):
+        # The extraction timestamp is the only line expected to differ
+        return {
+            path.name: [line for line in path.read_text().splitlines()
+                        if not line.startswith("Extraction Date:")]
+            for path in output_dir.iterdir()
+        }
+
+    def test_process_directory_pool_matches_serial(self, tmp_path, sample_10k_content):
+        """The process pool yields the same stats and outputs as the serial path."""
+        input_dir = tmp_path / "input"
+        self._write_filings(input_dir, sample_10k_content)
+
+        serial_dir = tmp_path / "serial"
+        pooled_dir = tmp_path / "pooled"
+        serial_stats = MDNAExtractor(serial_dir).process_directory(input_dir, max_workers=1)
+        pooled_stats = MDNAExtractor(pooled_dir).process_directory(input_dir, max_workers=2)
+
+        assert serial_stats["successful"] == 3
+        assert pooled_stats == serial_stats
+        assert self._read_outputs(pooled_dir) == self._read_outputs(serial_dir)
+
+    def test_process_directory_pool_counts_worker_errors(self, tmp_path, sample_10k_content):
+        """Workers use the subclass, and a file that raises counts as failed."""
+        input_dir = tmp_path / "input"
+        self._write_filings(input_dir, sample_10k_content)
+
+        stats = RaisingExtractor(tmp_path / "out").process_directory(input_dir, max_workers=2)
+
+        assert stats["total_files"] == 3
+        assert stats["successful"] == 0
+        assert stats["failed"] == 3
+
+    def test_process_directory_pool_passes_init_args(self, tmp_path, sample_10k_content):
+        """Workers rebuild a subclass with its own constructor arguments."""
+        input_dir = tmp_path / "input"
+        self._write_filings(input_dir, sample_10k_content)
+
+        stats = TaggedExtractor(tmp_path / "out", "tag").process_directory(input_dir, max_workers=2)
+
+        assert stats["successful"] == 3
+        assert stats["not_processed"] == 0
+
+    def test_process_directory_broken_pool_not_counted_as_failed(self, tmp_path, sample_10k_content):
+        """Files left without a result by a dead worker are reported as not processed."""
+        input_dir = tmp_path / "input"
+        self._write_filings(input_dir, sample_10k_content)
+
+        stats = ExitingExtractor(tmp_path / "out").process_directory(input_dir, max_workers=2)
+
+        assert stats["successful"] == 0
+        assert stats["failed"] == 0
+        assert stats["not_processed"] == 3
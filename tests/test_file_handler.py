@@ -0,0 +1,81 @@
+"""Tests for FileHandler reading and writing."""
+
+import pytest
+
+from config.settings import ENCODING_PREFERENCES
+from src.core.file_handler import FileHandler
+
+
+def text_mode_read(path):
+    """The text-mode read FileHandler.read_file replaced, as a reference."""
+    for encoding in ENCODING_PREFERENCES:
+        try:
+            with open(path, 'r', encoding=encoding) as f:
+                return f.read()
+        except UnicodeDecodeError:
+            continue
+
+
+class TestFileHandlerRead:
+    """read_file must match a text-mode read with the same encoding order."""
+
+    @pytest.fixture
+    def handler(self):
+        return FileHandler()
+
+    @pytest.mark.parametrize("raw", [
+        b"ITEM 7.\r\nOverview\r\n",              # CRLF
+        b"ITEM 7.\rOverview\r",                  # Lone CR
+        b"ITEM 7.\r\r\nOverview\n\r",            # Mixed runs
+        b"\xef\xbb\xbfFORM 10-K\r\nBody\n",      # UTF-8 BOM
+        b"caf\xe9 \x93quoted\x94\r\nnext",        # Not UTF-8: falls back
+    ])
+    def test_matches_text_mode_read(self, handler, tmp_path, raw):
+        path = tmp_path / "filing.txt"
+        path.write_bytes(raw)
+
+        assert handler.read_file(path) == text_mode_read(path)
+
+    def test_non_utf8_uses_fallback_encoding(self, handler, tmp_path):
+        path = tmp_path / "filing.txt"
+        path.write_bytes(b"caf\xe9\r\n")
+
+        assert handler.read_file(path) == "caf\xe9\n"
+
+    def test_empty_file(self, handler, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+
+        assert handler.read_file(path) == ""
+
+    def test_missing_file(self, handler, tmp_path):
+        assert handler.read_file(tmp_path / "missing.txt") is None
+
+
+class TestFileHandlerWrite:
+    """write_lines must write the same bytes as '\\n'.join plus write_file."""
+
+    @pytest.fixture
+    def handler(self):
+        return FileHandler()
+
+    @pytest.mark.parametrize("lines", [
+        ["MD&A", "", "Revenue   1,234", ""],   # Trailing newline
+        ["Single line"],
+        ["", "Leading blank line"],
+        ["caf\u00e9 \u2014 non-ASCII"],
+        [],
+    ])
+    def test_matches_joined_write(self, handler, tmp_path, lines):
+        joined = tmp_path / "joined.txt"
+        streamed = tmp_path / "out" / "streamed.txt"  # Parent is created
+        handler.write_file(joined, '\n'.join(lines))
+        handler.write_lines(streamed, iter(lines))
+
+        assert streamed.read_bytes() == joined.read_bytes()
+
+    def test_trailing_newline(self, handler, tmp_path):
+        path = tmp_path / "out.txt"
+        handler.write_lines(path, ["a", "b", ""])
+
+        assert path.read_bytes() == b"a\nb\n"
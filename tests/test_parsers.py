@@ -1,7 +1,16 @@
 """Tests for parser modules, including 10-Q fallback end logic."""
 
+import dataclasses
+import re
+
 import pytest
 from src.parsers.section_parser import SectionParser, SectionBoundary
+from src.parsers import table_parser
+from src.parsers.table_parser import Table, TableParser
+from src.parsers.text_normalizer import (
+    COLUMN_GAP_RE, has_column_gap, has_pipe_columns,
+    _PAGE_NUMBER_LINE_RE, _TOC_HEADER_RE, _remove_line_matches,
+)
 
 
 class TestSectionParser:
@@ -67,4 +76,163 @@ ITEM 7A. QUANTITATIVE AND QUALITATIVE DISCLOSURES
         end_pos = parser._find_10q_fallback_end(content, section.end_pos)
         assert end_pos is None
 
+    def test_find_all_section_matches_line_numbers(self, parser):
+        """Line numbers reported for every match are 1-based and exact."""
+        content = (
+            "Intro line\n"
+            "ITEM 7. MANAGEMENT'S DISCUSSION AND ANALYSIS\n"
+            "Body text\n"
+            "\n"
+            "ITEM 7. MANAGEMENT'S DISCUSSION AND ANALYSIS\n"
+        )
+        matches = parser._find_all_section_matches(content, 'item_7_start')
+        assert matches
+        for match in matches:
+            expected = content.count('\n', 0, match.start_pos) + 1
+            assert match.line_number == expected
+
 # Additional parser tests omitted for brevity
+
+
+class TestColumnGap:
+    """has_column_gap must agree with COLUMN_GAP_RE.search."""
+
+    @pytest.mark.parametrize("line, expected", [
+        ("Revenue\t\t\t1,234", True),       # Tab gap
+        ("Revenue \t 1,234", True),           # Mixed spaces and tab
+        ("Revenue\t1,234", False),            # Single tab is not a gap
+        ("Revenue   1,234", True),             # 3-space gap
+        ("Revenue  1,234  5,678", False),      # 2-space gaps only
+        ("Revenue\x0b\x0c\x851,234", True),   # Non-printable whitespace
+        ("Revenue\x00  1,234", False),        # Non-printable, 2-space gap
+        ("Revenue\u00a0\u00a0\u00a01,234", True),  # Non-breaking spaces
+        ("", False),
+    ])
+    def test_has_column_gap(self, line, expected):
+        assert has_column_gap(line) is expected
+        assert (COLUMN_GAP_RE.search(line) is not None) is expected
+
+
+class TestPipeColumns:
+    """has_pipe_columns must agree with line.count('|') >= 2."""
+
+    @pytest.mark.parametrize("line, expected", [
+        ("Revenue | 1,234", False),                   # Single pipe
+        ("| Revenue 1,234", False),                   # Leading pipe only
+        ("Revenue 1,234 |", False),                   # Trailing pipe only
+        ("| Revenue 1,234 |", True),                  # Leading and trailing
+        ("Segment | Units | Growth", True),           # Multi-column row
+        ("| North | 120 | 5% |", True),
+        ("||", True),
+        ("No pipes at all", False),
+        ("", False),
+    ])
+    def test_has_pipe_columns(self, line, expected):
+        assert has_pipe_columns(line) is expected
+        assert (line.count('|') >= 2) is expected
+
+
+class TestRemoveLineMatches:
+    """_remove_line_matches must reproduce the ^\\s* MULTILINE re.sub it replaced."""
+
+    # The patterns as they were before the rewrite
+    OLD_TOC_HEADER_RE = re.compile(r'^\s*Table\s+of\s+Contents\s*$', re.MULTILINE | re.IGNORECASE)
+    OLD_PAGE_NUMBER_LINE_RE = re.compile(r'^\s*\d{1,3}\s*$', re.MULTILINE)
+
+    @pytest.mark.parametrize("text", [
+        "Intro\n\n\n12\nBody",                        # Blank run before a match
+        "Intro\n \n\t\n  \n12\n\n\nBody",             # Whitespace-only lines
+        "Intro\n\n12\n\n\n34\n\nBody",                # Back-to-back matches
+        "Intro\r\n\r\n12\r\nBody",                     # CRLF
+        "Intro\n\r\n  7 \r\nBody\r",                  # Lone and trailing CR
+        "Intro\n\x0b\n\x0c12\x0c\nBody",               # Vertical tab, form feed
+        "Intro\n\x85\n12\x85\n\x85Body",               # NEL
+        "12\nBody\n",                                  # Match on the first line
+        "\n\n  12",                                    # Match on the last line
+        "Body\n\n\n99",                               # Last line after a blank run
+        "Intro\n\n1234\nBody",                         # Too many digits
+        "\n  Table of Contents  \n\nBody",             # TOC header
+        "Intro\n\n TABLE  OF\nCONTENTS\n\n5\nBody",    # Header across lines
+        "",
+    ])
+    def test_matches_old_sub(self, text):
+        assert (_remove_line_matches(_PAGE_NUMBER_LINE_RE, text)
+                == self.OLD_PAGE_NUMBER_LINE_RE.sub('', text))
+        assert (_remove_line_matches(_TOC_HEADER_RE, text)
+                == self.OLD_TOC_HEADER_RE.sub('', text))
+
+    def test_long_blank_run(self):
+        text = "Intro\n" + " \n" * 5000 + "12\n" + "\n" * 5000 + "Body"
+
+        assert (_remove_line_matches(_PAGE_NUMBER_LINE_RE, text)
+                == self.OLD_PAGE_NUMBER_LINE_RE.sub('', text))
+
+
+class TestTableParser:
+    """Test suite for TableParser detection and preservation."""
+
+    @pytest.fixture
+    def parser(self):
+        return TableParser()
+
+    @pytest.fixture
+    def document(self):
+        return (
+            "Results of Operations\n"
+            "\n"
+            "Revenue grew during the year as described below.\n"
+            "\n"
+            "Consolidated Statements of Operations\n"
+            "                          2023        2022\n"
+            "Revenue               $ 1,234     $ 1,100\n"
+            "Cost of sales            (800)       (700)\n"
+            "Total                 $   434     $   400\n"
+            "\n"
+            "Liquidity discussion follows in prose form.\n"
+            "\n"
+            "Segment       Units     Growth\n"
+            "-----------------------------------\n"
+            "North          120        5%\n"
+            "South           80        3%\n"
+            "\n"
+            "Closing remarks.\n"
+        )
+
+    def test_parse_matches_identify_tables(self, parser, document):
+        lines, tables = parser.parse(document)
+
+        assert lines == document.split('\n')
+        assert [t.table_type for t in tables] == ['financial', 'delimited']
+        assert tables == parser.identify_tables(document)
+
+    def test_preserve_tables_in_lines_matches_text(self, parser, document):
+        """Split-once preservation gives the same text as the text-based path."""
+        expected = parser.preserve_tables_in_text(document, parser.identify_tables(document))
+
+        assert parser.preserve_tables_in_lines(*parser.parse(document)) == expected
+
+    def test_line_caches_stay_bounded(self, parser, monkeypatch):
+        """A predicate's cache is cleared once it reaches LINE_CACHE_SIZE lines."""
+        monkeypatch.setattr(table_parser, 'LINE_CACHE_SIZE', 3)
+        lines = [f"Revenue {i}   $ {i},000" for i in range(10)]
+
+        results = [parser._is_table_line(line) for line in lines]
+
+        assert all(0 < len(cache) <= 3 for cache in parser._line_caches.values())
+        assert results == [TableParser()._is_table_line(line) for line in lines]
+
+    def test_table_original_text(self):
+        """original_text is a plain field; None falls back to raw_lines when preserving."""
+        fields = dict(content=[], start_pos=0, end_pos=0, start_line=1, end_line=2,
+                      title=None, confidence=0.9, table_type='aligned')
+        lines = ["Intro", "A   1", "B   2", "Outro"]
+
+        given = Table(*fields.values(), "A   1\nB   2", [])
+        derived = Table(**fields, original_text=None, raw_lines=["A   1", "B   2"])
+
+        assert given.original_text == "A   1\nB   2"
+        assert derived.original_text is None
+        assert given != Table(*fields.values(), "X   9\nY   8", [])
+        assert 'original_text' in dataclasses.asdict(derived)
+        assert (TableParser().preserve_tables_in_lines(lines, [given])
+                == TableParser().preserve_tables_in_lines(lines, [derived]))